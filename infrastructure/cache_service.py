@@ -7,25 +7,53 @@ import hashlib
 import json
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+# 타입 태그만으로 1/True/1.0 같은 값을 구분할 수 있는 스칼라 타입 (중첩 컨테이너 제외)
+_MEMOIZABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _digest_key(key_data: dict[str, Any]) -> str:
+    """키 데이터를 정렬 직렬화한 뒤 해시 (중첩 값까지 키 순서를 정규화)"""
+    key_string = json.dumps(key_data, sort_keys=True)
+    return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _memoized_key(query: str, mode: str, tagged_kwargs: tuple) -> str:
+    """(이름, 타입, 값)으로 태그한 인자 기준으로 직렬화 전에 메모이즈한 캐시 키"""
+    kwargs = {name: value for name, _, value in tagged_kwargs}
+    return _digest_key({"query": query, "mode": mode, **kwargs})
+
+
 class CacheService:
     """세션 캐시 및 성능 최적화 서비스"""
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 3600,
+        time_source: Callable[[], float] | None = None,
+    ):
         """
         캐시 서비스 초기화
 
         Args:
             max_size: 최대 캐시 항목 수
             ttl_seconds: 캐시 TTL (초)
+            time_source: 현재 시각 함수 (기본값 time.monotonic)
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: dict[str, dict[str, Any]] = {}
+        self.time_source = time_source or time.monotonic
+        # 접근 순서를 유지하여 가장 오래된 항목이 맨 앞에 오도록 관리
+        self.cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self.access_times: dict[str, float] = {}
         self.hit_count = 0
         self.miss_count = 0
@@ -34,18 +62,25 @@ class CacheService:
 
     def _generate_key(self, query: str, mode: str, **kwargs) -> str:
         """캐시 키 생성"""
-        # 쿼리와 모드를 기반으로 해시 키 생성
-        key_data = {"query": query, "mode": mode, **kwargs}
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # 모든 값이 스칼라면 타입을 붙여 메모이즈해 반복 조회 시 직렬화를 건너뜀
+        # (같다고 비교되지만 타입이 다른 값(1/True/1.0)이 합쳐지지 않도록 타입 포함)
+        values = (query, mode, *kwargs.values())
+        if all(type(value) in _MEMOIZABLE_TYPES for value in values):
+            tagged_kwargs = tuple(
+                sorted((name, type(value), value) for name, value in kwargs.items())
+            )
+            return _memoized_key(query, mode, tagged_kwargs)
+
+        # dict/list 등 컨테이너 값은 메모이즈 없이 직렬화
+        return _digest_key({"query": query, "mode": mode, **kwargs})
 
     def _is_expired(self, timestamp: float) -> bool:
         """캐시 항목 만료 여부 확인"""
-        return time.time() - timestamp > self.ttl_seconds
+        return self.time_source() - timestamp > self.ttl_seconds
 
     def _cleanup_expired(self):
         """만료된 캐시 항목 정리"""
-        current_time = time.time()
+        current_time = self.time_source()
         expired_keys = [
             key
             for key, timestamp in self.access_times.items()
@@ -62,11 +97,8 @@ class CacheService:
     def _evict_lru(self):
         """LRU 방식으로 캐시 항목 제거"""
         if len(self.cache) >= self.max_size:
-            # 가장 오래된 항목 찾기
-            oldest_key = min(
-                self.access_times.keys(), key=lambda k: self.access_times[k]
-            )
-            self.cache.pop(oldest_key, None)
+            # 맨 앞 항목이 가장 오래 접근되지 않은 항목
+            oldest_key, _ = self.cache.popitem(last=False)
             self.access_times.pop(oldest_key, None)
             logger.debug(f"LRU 캐시 항목 제거: {oldest_key}")
 
@@ -92,8 +124,9 @@ class CacheService:
 
             # TTL 확인
             if not self._is_expired(cache_entry["timestamp"]):
-                # 접근 시간 업데이트
-                self.access_times[key] = time.time()
+                # 접근 시간 및 LRU 순서 업데이트
+                self.access_times[key] = self.time_source()
+                self.cache.move_to_end(key)
                 self.hit_count += 1
                 logger.debug(f"캐시 히트: {key}")
                 return cache_entry["data"]
@@ -119,18 +152,20 @@ class CacheService:
         """
         key = self._generate_key(query, mode, **kwargs)
 
-        # 캐시 크기 확인 및 LRU 제거
-        if len(self.cache) >= self.max_size:
+        # 기존 키는 순서만 갱신하고, 새 키일 때만 크기 확인 및 LRU 제거
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
             self._evict_lru()
 
         # 캐시 항목 저장
         self.cache[key] = {
             "data": data,
-            "timestamp": time.time(),
+            "timestamp": self.time_source(),
             "query": query,
             "mode": mode,
         }
-        self.access_times[key] = time.time()
+        self.access_times[key] = self.time_source()
 
         logger.debug(f"캐시 저장: {key}")
 
@@ -194,7 +229,7 @@ class CacheService:
     def get_cache_info(self) -> list[dict[str, Any]]:
         """캐시 정보 반환 (디버깅용)"""
         cache_info = []
-        current_time = time.time()
+        current_time = self.time_source()
 
         for key, cache_entry in self.cache.items():
             age = current_time - cache_entry["timestamp"]
@@ -244,6 +279,20 @@ class QueryCache:
         """혼합 결과 캐시 저장"""
         self.cache_service.set(query, "mixed", result, **kwargs)
 
+    def set_many(self, entries: dict[tuple[str, str], Any], **kwargs) -> None:
+        """(모드, 쿼리) 키별 결과 일괄 저장"""
+        for (mode, query), result in entries.items():
+            self.cache_service.set(query, mode, result, **kwargs)
+
+    def get_many(
+        self, keys: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], Any | None]:
+        """(모드, 쿼리) 키별 결과 일괄 조회"""
+        return {
+            (mode, query): self.cache_service.get(query, mode, **kwargs)
+            for mode, query in keys
+        }
+
 
 # 전역 캐시 서비스 인스턴스
 _cache_service = None
@@ -6,6 +6,7 @@ development-policy.mdc 규칙에 따른 에러 모델 구현
 import json
 import logging
 import time
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
@@ -106,7 +107,7 @@ class ErrorHandler:
     def __init__(self):
         self.logger = StructuredLogger("error_handler")
         self.retry_config = RetryConfig()
-        self.error_counts = {}
+        self.error_counts = Counter()
         self.circuit_breakers = {}
     
     def handle_exception(
@@ -208,8 +209,6 @@ class ErrorHandler:
     
     def _update_error_count(self, error_type: ErrorType):
         """에러 카운트 업데이트"""
-        if error_type not in self.error_counts:
-            self.error_counts[error_type] = 0
         self.error_counts[error_type] += 1
     
     def retry_with_backoff(
@@ -400,11 +399,22 @@ class ErrorHandler:
     def get_error_stats(self) -> dict[str, Any]:
         """에러 통계 반환"""
         return {
-            "error_counts": self.error_counts.copy(),
+            "error_counts": dict(self.error_counts),
             "total_errors": sum(self.error_counts.values()),
             "circuit_breakers": self.circuit_breakers.copy()
         }
     
+    def get_error_summary(self, errors: list[StandardError]) -> dict[str, Any]:
+        """에러 목록 요약 (타입별 개수 및 최빈 에러 타입)"""
+        counts = Counter(error.error_type.value for error in errors)
+        most_common = counts.most_common(1)[0][0] if counts else None
+        
+        return {
+            "total_errors": len(errors),
+            "error_type_counts": dict(counts),
+            "most_common_error": most_common
+        }
+    
     def reset_error_counts(self):
         """에러 카운트 리셋"""
         self.error_counts.clear()
@@ -5,10 +5,33 @@ development-policy.mdc 규칙에 따른 JSON 로그 구현
 
 import json
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 키 이름에 포함되면 마스킹하는 민감정보 패턴 (대소문자 무시)
+_SENSITIVE_KEY_RE = re.compile("password|api_key|token|secret|key")
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """민감정보 키 여부 (로그 키는 반복되므로 키별 판정 결과 캐시)"""
+    return _SENSITIVE_KEY_RE.search(key.lower()) is not None
+
+
+def _dumps_log_entry(log_entry: dict[str, Any]) -> str:
+    """로그 엔트리 JSON 직렬화 (orjson이 있으면 사용, 없으면 공백 없는 json)"""
+    if orjson is not None:
+        return orjson.dumps(log_entry, default=str).decode()
+    return json.dumps(log_entry, ensure_ascii=False, separators=(",", ":"), default=str)
+
 
 class StructuredLogger:
     """구조화된 JSON 로그를 제공하는 로거"""
@@ -67,11 +90,10 @@ class StructuredLogger:
 
     def _mask_sensitive_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """민감정보 마스킹"""
-        sensitive_keys = ["password", "api_key", "token", "secret", "key"]
         masked_data = {}
 
         for key, value in data.items():
-            if any(sensitive in key.lower() for sensitive in sensitive_keys):
+            if _is_sensitive_key(key):
                 masked_data[key] = "***MASKED***"
             elif isinstance(value, dict):
                 masked_data[key] = self._mask_sensitive_data(value)
@@ -83,22 +105,22 @@ class StructuredLogger:
     def info(self, message: str, **kwargs):
         """INFO 레벨 로그"""
         log_entry = self._create_log_entry("INFO", message, **kwargs)
-        self.logger.info(json.dumps(log_entry, ensure_ascii=False))
+        self.logger.info(_dumps_log_entry(log_entry))
 
     def debug(self, message: str, **kwargs):
         """DEBUG 레벨 로그"""
         log_entry = self._create_log_entry("DEBUG", message, **kwargs)
-        self.logger.debug(json.dumps(log_entry, ensure_ascii=False))
+        self.logger.debug(_dumps_log_entry(log_entry))
 
     def warning(self, message: str, **kwargs):
         """WARNING 레벨 로그"""
         log_entry = self._create_log_entry("WARNING", message, **kwargs)
-        self.logger.warning(json.dumps(log_entry, ensure_ascii=False))
+        self.logger.warning(_dumps_log_entry(log_entry))
 
     def error(self, message: str, **kwargs):
         """ERROR 레벨 로그"""
         log_entry = self._create_log_entry("ERROR", message, **kwargs)
-        self.logger.error(json.dumps(log_entry, ensure_ascii=False))
+        self.logger.error(_dumps_log_entry(log_entry))
 
     def log_query(
         self,
@@ -3,10 +3,12 @@
 data_sites.txt에 있는 데이터 포털 사이트들을 활용한 외부 데이터 수집 및 통합
 """
 
+import asyncio
 import logging
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -248,34 +250,33 @@ class ExternalDataService:
         self.cache_ttl = 3600  # 1시간 캐시
     
     def search_all_portals(self, query: str, max_results_per_portal: int = 5) -> List[ExternalDataResult]:
-        """모든 포털에서 데이터 검색"""
+        """모든 포털에서 데이터 검색 (search_all_portals_async의 동기 래퍼)
+
+        이미 실행 중인 이벤트 루프 안에서 호출되면 asyncio.run을 쓸 수 없으므로
+        별도 스레드의 새 루프에서 실행한다. 비동기 호출자는 search_all_portals_async를 직접 await한다.
+        """
+        coro = self.search_all_portals_async(query, max_results_per_portal)
         try:
-            all_results = []
-            
-            for portal_name, portal in self.portals.items():
-                try:
-                    # 캐시 확인
-                    cache_key = f"{portal_name}_{query}_{max_results_per_portal}"
-                    if cache_key in self.cache:
-                        cached_data, timestamp = self.cache[cache_key]
-                        if time.time() - timestamp < self.cache_ttl:
-                            logger.info(f"캐시에서 결과 반환: {portal_name}")
-                            all_results.extend(cached_data)
-                            continue
-                    
-                    # 포털별 검색 실행
-                    results = portal.search_data(query, max_results_per_portal)
-                    all_results.extend(results)
-                    
-                    # 캐시 저장
-                    self.cache[cache_key] = (results, time.time())
-                    
-                    # 요청 간격 조절
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"{portal_name} 포털 검색 실패: {str(e)}")
-                    continue
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def search_all_portals_async(self, query: str, max_results_per_portal: int = 5) -> List[ExternalDataResult]:
+        """모든 포털에서 데이터 동시 검색
+        
+        포털마다 별도 스레드에서 검색을 실행하므로 전체 소요 시간은
+        포털별 응답 시간의 합이 아니라 가장 느린 포털의 응답 시간이 된다.
+        각 포털은 자신의 requests.Session을 재사용하므로 연결도 유지된다.
+        """
+        try:
+            portal_results = await asyncio.gather(*(
+                asyncio.to_thread(self._search_portal_cached, portal_name, portal, query, max_results_per_portal)
+                for portal_name, portal in self.portals.items()
+            ))
+            all_results = [result for results in portal_results for result in results]
             
             # 결과 정렬 및 중복 제거
             unique_results = self._deduplicate_results(all_results)
@@ -288,6 +289,29 @@ class ExternalDataService:
             logger.error(f"외부 데이터 검색 실패: {str(e)}")
             return []
     
+    def _search_portal_cached(self, portal_name: str, portal: ExternalDataPortal, query: str,
+                              max_results: int) -> List[ExternalDataResult]:
+        """캐시를 거쳐 단일 포털 검색"""
+        try:
+            # 캐시 확인
+            cache_key = f"{portal_name}_{query}_{max_results}"
+            if cache_key in self.cache:
+                cached_data, timestamp = self.cache[cache_key]
+                if time.time() - timestamp < self.cache_ttl:
+                    logger.info(f"캐시에서 결과 반환: {portal_name}")
+                    return cached_data
+            
+            # 포털별 검색 실행
+            results = portal.search_data(query, max_results)
+            
+            # 캐시 저장
+            self.cache[cache_key] = (results, time.time())
+            return results
+            
+        except Exception as e:
+            logger.error(f"{portal_name} 포털 검색 실패: {str(e)}")
+            return []
+    
     def search_specific_portal(self, portal_name: str, query: str, max_results: int = 10) -> List[ExternalDataResult]:
         """특정 포털에서 데이터 검색"""
         try:
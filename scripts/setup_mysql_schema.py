@@ -119,9 +119,9 @@ def verify_schema(connection: mysql.connector.MySQLConnection) -> bool:
         ]
 
         cursor.execute("SHOW TABLES")
-        existing_tables = [table[0] for table in cursor.fetchall()]
+        existing_tables = {table[0] for table in cursor}
 
-        logger.info(f"Existing tables: {existing_tables}")
+        logger.info(f"Existing tables: {sorted(existing_tables)}")
 
         # Verify all required tables exist
         missing_tables = [table for table in required_tables if table not in existing_tables]
@@ -4,10 +4,11 @@ Full System Test for Seoul Commercial Analysis LLM System
 Tests all 4 tasks: Project Bootstrap, MySQL Schema, Text-to-SQL & RAG, Streamlit Frontend
 """
 
+import ast
+import importlib.util
 import sys
 from pathlib import Path
 import logging
-import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,6 +18,13 @@ sys.path.insert(0, str(project_root))
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _app_function_names():
+    """Parse app.py for top-level function names (avoids importing streamlit)"""
+    spec = importlib.util.find_spec('app')
+    assert spec and spec.origin, "app module must be importable"
+    tree = ast.parse(Path(spec.origin).read_text(encoding='utf-8-sig'))
+    return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+
 def test_task1_bootstrap():
     """Test TASK 1: Project Bootstrap"""
     logger.info("=== Testing TASK 1: Project Bootstrap ===")
@@ -32,11 +40,11 @@ def test_task1_bootstrap():
         logger.info("✅ All utility modules imported successfully")
 
         # Test app module
-        import app
-        assert hasattr(app, 'main'), "App must have main function"
-        assert hasattr(app, 'render_sql_tab'), "App must have render_sql_tab function"
-        assert hasattr(app, 'render_rag_tab'), "App must have render_rag_tab function"
-        assert hasattr(app, 'render_report_tab'), "App must have render_report_tab function"
+        app_functions = _app_function_names()
+        assert 'main' in app_functions, "App must have main function"
+        assert 'render_sql_tab' in app_functions, "App must have render_sql_tab function"
+        assert 'render_rag_tab' in app_functions, "App must have render_rag_tab function"
+        assert 'render_report_tab' in app_functions, "App must have render_report_tab function"
 
         logger.info("✅ App module structure verified")
         return True
@@ -81,6 +89,7 @@ def test_task3_text2sql_rag():
     logger.info("=== Testing TASK 3: Text-to-SQL & Hybrid RAG ===")
 
     try:
+        import pandas as pd
         from utils.sql_text2sql import nl_to_sql
         from utils.dao import run_sql
         from utils.rag_hybrid import index_pdfs, hybrid_search
@@ -122,9 +131,6 @@ def test_task4_frontend():
     logger.info("=== Testing TASK 4: Streamlit Frontend ===")
 
     try:
-        import streamlit as st
-        import app
-
         # Test app functions exist
         required_functions = [
             'render_sql_tab',
@@ -133,12 +139,16 @@ def test_task4_frontend():
             'render_data_loading_section'
         ]
 
+        app_functions = _app_function_names()
         for func_name in required_functions:
-            assert hasattr(app, func_name), f"App must have {func_name} function"
-            assert callable(getattr(app, func_name)), f"{func_name} must be callable"
+            assert func_name in app_functions, f"App must have {func_name} function"
 
         logger.info("✅ All required UI functions available")
 
+        # Only the report check below needs to execute app code
+        import pandas as pd
+        import app
+
         # Test report composition using app function
         # Create sample data
         sample_df = pd.DataFrame({
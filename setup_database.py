@@ -107,21 +107,24 @@ def verify_tables(connection, database_name):
         cursor.execute("SHOW TABLES")
         tables = cursor.fetchall()
 
-        logger.info(f"생성된 테이블 목록 ({database_name}):")
-        for table in tables:
-            logger.info(f"  - {table[0]}")
+        logger.info("생성된 테이블 목록 (%s):\n%s", database_name,
+                    "\n".join(f"  - {table[0]}" for table in tables))
 
         # sales_data 테이블 구체적 확인
         cursor.execute("DESCRIBE sales_data")
         columns = cursor.fetchall()
-        logger.info("sales_data 테이블 구조:")
-        for column in columns:
-            logger.info(f"  - {column[0]}: {column[1]}")
-
-        # 샘플 데이터 확인
-        cursor.execute("SELECT COUNT(*) FROM sales_data")
-        count = cursor.fetchone()[0]
-        logger.info(f"sales_data 테이블 데이터 개수: {count}")
+        logger.info("sales_data 테이블 구조:\n%s",
+                    "\n".join(f"  - {column[0]}: {column[1]}" for column in columns))
+
+        # 샘플 데이터 확인 - COUNT(*) 전체 스캔 대신 InnoDB 통계 기반 추정치 사용
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.tables "
+            "WHERE table_schema = %s AND table_name = 'sales_data'",
+            (database_name,)
+        )
+        row = cursor.fetchone()
+        count = row[0] if row else 0
+        logger.info(f"sales_data 테이블 데이터 개수 (추정): {count}")
 
         cursor.close()
         return True
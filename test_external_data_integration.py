@@ -27,9 +27,8 @@ def test_external_data_service():
         
         # 사용 가능한 포털 목록 확인
         portals = service.get_portal_list()
-        logger.info(f"✅ 사용 가능한 포털: {len(portals)}개")
-        for portal in portals:
-            logger.info(f"  - {portal['display_name']}: {portal['base_url']}")
+        logger.info("✅ 사용 가능한 포털: %d개\n%s", len(portals),
+                    "\n".join(f"  - {portal['display_name']}: {portal['base_url']}" for portal in portals))
         
         # 테스트 검색 실행
         test_query = "서울시 상권 데이터"
@@ -38,9 +37,9 @@ def test_external_data_service():
         results = service.search_all_portals(test_query, max_results_per_portal=3)
         
         if results:
-            logger.info(f"✅ 검색 성공: {len(results)}개 결과")
-            for i, result in enumerate(results[:3], 1):
-                logger.info(f"  {i}. {result.title[:50]}... (출처: {result.source})")
+            logger.info("✅ 검색 성공: %d개 결과\n%s", len(results),
+                        "\n".join(f"  {i}. {result.title[:50]}... (출처: {result.source})"
+                                  for i, result in enumerate(results[:3], 1)))
         else:
             logger.warning("⚠️ 검색 결과가 없습니다")
         
@@ -76,13 +75,15 @@ def test_hybrid_service():
             
             # 소스별 결과 분포 확인
             if "source_breakdown" in result:
-                logger.info("📊 소스별 결과 분포:")
-                for source, count in result["source_breakdown"].items():
-                    logger.info(f"  - {source}: {count}개")
+                logger.info("📊 소스별 결과 분포:\n%s",
+                            "\n".join(f"  - {source}: {count}개" for source, count in result["source_breakdown"].items()))
             
             # 상위 3개 결과 표시
-            for i, res in enumerate(result["results"][:3], 1):
-                logger.info(f"  {i}. {res['title'][:50]}... (타입: {res['result_type']}, 점수: {res['relevance_score']:.2f})")
+            if result["results"]:
+                logger.info("\n".join(
+                    f"  {i}. {res['title'][:50]}... (타입: {res['result_type']}, 점수: {res['relevance_score']:.2f})"
+                    for i, res in enumerate(result["results"][:3], 1)
+                ))
         else:
             logger.warning(f"⚠️ 하이브리드 검색 실패: {result.get('error', 'Unknown error')}")
         
@@ -153,8 +154,7 @@ def test_intent_router():
             logger.info(f"✅ 라우팅 결과: {result['mode'].value} (신뢰도: {result['confidence']:.2f})")
             
             if result['reasoning']:
-                for reason in result['reasoning']:
-                    logger.info(f"  📋 이유: {reason}")
+                logger.info("\n".join(f"  📋 이유: {reason}" for reason in result['reasoning']))
         
         return True
         
@@ -3,12 +3,22 @@
 Task1 완료 기준: .env.example의 키 이름/설명 명확
 """
 
+import os
+import re
 from pathlib import Path
 
 import pytest
 from dotenv import load_dotenv
 
 
+def _defined_keys(content, keys):
+    """content에서 KEY= 형태로 정의된 keys를 한 번의 정규식 스캔으로 수집"""
+    pattern = re.compile(
+        r"^(" + "|".join(map(re.escape, keys)) + r")=", re.MULTILINE
+    )
+    return {match.group(1) for match in pattern.finditer(content)}
+
+
 class TestEnvironment:
     """환경 변수 테스트"""
 
@@ -17,12 +27,9 @@ class TestEnvironment:
         env_example_path = Path("env.example")
         assert env_example_path.exists(), "env.example 파일이 존재하지 않습니다"
 
-    def test_env_example_has_required_keys(self):
+    def test_env_example_has_required_keys(self, env_example_content):
         """env.example에 필수 키들이 있는지 테스트"""
-        env_example_path = Path("env.example")
-
-        with open(env_example_path, encoding="utf-8") as f:
-            content = f.read()
+        content = env_example_content
 
         # Task1에서 요구하는 필수 키들
         required_keys = [
@@ -42,25 +49,20 @@ class TestEnvironment:
             "ALPHA",
         ]
 
-        missing_keys = []
-        for key in required_keys:
-            if f"{key}=" not in content:
-                missing_keys.append(key)
+        found = _defined_keys(content, required_keys)
+        missing_keys = [key for key in required_keys if key not in found]
 
         assert not missing_keys, f"env.example에 누락된 키들: {missing_keys}"
 
-    def test_env_example_format(self):
+    def test_env_example_format(self, env_example_content):
         """env.example 파일 형식 테스트"""
-        env_example_path = Path("env.example")
-
-        with open(env_example_path, encoding="utf-8") as f:
-            lines = f.readlines()
+        lines = env_example_content.splitlines()
 
         # 빈 줄과 주석을 제외한 실제 설정 라인들
         config_lines = [
-            line.strip()
-            for line in lines
-            if line.strip() and not line.strip().startswith("#")
+            stripped
+            for stripped in (line.strip() for line in lines)
+            if stripped and not stripped.startswith("#")
         ]
 
         for line in config_lines:
@@ -79,23 +81,23 @@ class TestEnvironment:
         except Exception as e:
             pytest.fail(f"환경 파일 로드 중 예상치 못한 오류: {e}")
 
-    def test_env_loading_with_example_file(self):
+    def test_env_loading_with_example_file(self, env_example_values, monkeypatch):
         """env.example 파일로 로드 테스트"""
-        env_example_path = Path("env.example")
-        if env_example_path.exists():
-            try:
-                load_dotenv(env_example_path)
-                # 로드 성공 확인
-                assert True
-            except Exception as e:
-                pytest.fail(f"env.example 로드 실패: {e}")
-
-    def test_required_env_vars_structure(self):
-        """필수 환경 변수 구조 테스트"""
-        env_example_path = Path("env.example")
+        assert env_example_values, "env.example에서 로드된 값이 없습니다"
+
+        # 테스트 종료 시 원래 값으로 복원되도록 monkeypatch에 먼저 등록한 뒤 실제로 로드
+        for key in env_example_values:
+            monkeypatch.setenv(key, "")
+        load_dotenv("env.example", override=True)
+
+        for key, value in env_example_values.items():
+            assert (
+                os.environ[key] == value
+            ), f"환경 변수 {key}가 env.example 값으로 로드되지 않았습니다"
 
-        with open(env_example_path, encoding="utf-8") as f:
-            content = f.read()
+    def test_required_env_vars_structure(self, env_example_content):
+        """필수 환경 변수 구조 테스트"""
+        content = env_example_content
 
         # 데이터베이스 관련 키들
         db_keys = [
@@ -106,13 +108,9 @@ class TestEnvironment:
             "DB_PASSWORD",
             "DB_NAME",
         ]
-        for key in db_keys:
-            assert f"{key}=" in content, f"데이터베이스 관련 키 {key}가 없습니다"
 
         # LLM 관련 키들
         llm_keys = ["HF_MODEL", "HF_API_KEY", "HF_TEMPERATURE", "HF_MAX_TOKENS"]
-        for key in llm_keys:
-            assert f"{key}=" in content, f"LLM 관련 키 {key}가 없습니다"
 
         # RAG 관련 키들
         rag_keys = [
@@ -123,15 +121,25 @@ class TestEnvironment:
             "TOP_K",
             "ALPHA",
         ]
+
+        found = _defined_keys(content, db_keys + llm_keys + rag_keys)
+
+        for key in db_keys:
+            assert key in found, f"데이터베이스 관련 키 {key}가 없습니다"
+
+        for key in llm_keys:
+            assert key in found, f"LLM 관련 키 {key}가 없습니다"
+
         for key in rag_keys:
-            assert f"{key}=" in content, f"RAG 관련 키 {key}가 없습니다"
+            assert key in found, f"RAG 관련 키 {key}가 없습니다"
 
-    def test_env_example_has_comments(self):
+    def test_env_example_has_comments(self, env_example_content):
         """env.example에 설명 주석이 있는지 테스트"""
-        env_example_path = Path("env.example")
-
-        with open(env_example_path, encoding="utf-8") as f:
-            content = f.read()
+        comment_lines = frozenset(
+            line.strip()
+            for line in env_example_content.splitlines()
+            if line.lstrip().startswith("#")
+        )
 
         # 섹션별 주석이 있는지 확인
         section_comments = [
@@ -144,7 +152,7 @@ class TestEnvironment:
         ]
 
         for comment in section_comments:
-            assert comment in content, f"섹션 주석 {comment}가 없습니다"
+            assert comment in comment_lines, f"섹션 주석 {comment}가 없습니다"
 
 
 if __name__ == "__main__":
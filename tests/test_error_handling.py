@@ -5,7 +5,6 @@ TASK-015: 로깅/에러 표준화
 
 import pytest
 import time
-from unittest.mock import Mock, patch
 
 from infrastructure.error_handler import (
     ErrorHandler, ErrorType, ErrorSeverity, StandardError, RetryConfig,
@@ -19,10 +18,16 @@ from infrastructure.decorators import (
 class TestErrorHandler:
     """에러 핸들러 테스트"""
 
-    def test_create_error(self):
-        """표준 에러 생성 테스트"""
+    @pytest.fixture
+    def fresh_handler(self):
+        """상태(에러 카운트)를 변경하는 리트라이 테스트용 에러 핸들러"""
         handler = ErrorHandler()
-        
+        # 백오프 대기 없이 리트라이
+        handler.retry_config = RetryConfig(base_delay=0.0, jitter=False)
+        return handler
+
+    def test_create_error(self, handler):
+        """표준 에러 생성 테스트"""
         error = handler.create_error(
             error_type=ErrorType.VALIDATION_ERROR,
             message="Test validation error",
@@ -40,10 +45,8 @@ class TestErrorHandler:
         assert error.context["operation"] == "test_operation"
         assert error.retryable is False
 
-    def test_handle_exception(self):
+    def test_handle_exception(self, handler):
         """예외 처리 테스트"""
-        handler = ErrorHandler()
-        
         # ValueError 예외 처리
         try:
             raise ValueError("Test value error")
@@ -55,10 +58,8 @@ class TestErrorHandler:
             assert error.original_error == e
             assert error.context["test"] == "context"
 
-    def test_handle_network_exception(self):
+    def test_handle_network_exception(self, handler):
         """네트워크 예외 처리 테스트"""
-        handler = ErrorHandler()
-        
         try:
             raise ConnectionError("Test connection error")
         except Exception as e:
@@ -67,60 +68,39 @@ class TestErrorHandler:
             assert error.error_type == ErrorType.NETWORK_ERROR
             assert error.retryable is True
 
-    def test_validate_input_success(self):
-        """입력 검증 성공 테스트"""
-        handler = ErrorHandler()
-        
-        data = {"name": "test", "age": 25, "email": "test@example.com"}
-        rules = {
-            "required_fields": ["name", "age"],
-            "type_checks": {"age": int, "name": str},
-            "range_checks": {"age": (0, 100)}
-        }
-        
-        error = handler.validate_input(data, rules)
-        assert error is None
-
-    def test_validate_input_missing_field(self):
-        """입력 검증 실패 - 필수 필드 누락"""
-        handler = ErrorHandler()
-        
-        data = {"name": "test"}
-        rules = {"required_fields": ["name", "age"]}
-        
-        error = handler.validate_input(data, rules)
-        assert error is not None
-        assert error.error_type == ErrorType.VALIDATION_ERROR
-        assert "age" in error.message
-
-    def test_validate_input_wrong_type(self):
-        """입력 검증 실패 - 잘못된 타입"""
-        handler = ErrorHandler()
-        
-        data = {"age": "not_a_number"}
-        rules = {"type_checks": {"age": int}}
-        
+    @pytest.mark.parametrize(
+        "data,rules,expect_error,expect_substr",
+        [
+            (
+                {"name": "test", "age": 25, "email": "test@example.com"},
+                {
+                    "required_fields": ["name", "age"],
+                    "type_checks": {"age": int, "name": str},
+                    "range_checks": {"age": (0, 100)}
+                },
+                False,
+                None,
+            ),
+            ({"name": "test"}, {"required_fields": ["name", "age"]}, True, "age"),
+            ({"age": "not_a_number"}, {"type_checks": {"age": int}}, True, "wrong type"),
+            ({"age": 150}, {"range_checks": {"age": (0, 100)}}, True, "out of range"),
+        ],
+        ids=["success", "missing_field", "wrong_type", "out_of_range"],
+    )
+    def test_validate_input(self, handler, data, rules, expect_error, expect_substr):
+        """입력 검증 테스트 (성공/필수 필드 누락/잘못된 타입/범위 초과)"""
         error = handler.validate_input(data, rules)
-        assert error is not None
-        assert error.error_type == ErrorType.VALIDATION_ERROR
-        assert "wrong type" in error.message
-
-    def test_validate_input_out_of_range(self):
-        """입력 검증 실패 - 범위 초과"""
-        handler = ErrorHandler()
         
-        data = {"age": 150}
-        rules = {"range_checks": {"age": (0, 100)}}
+        if not expect_error:
+            assert error is None
+            return
         
-        error = handler.validate_input(data, rules)
         assert error is not None
         assert error.error_type == ErrorType.VALIDATION_ERROR
-        assert "out of range" in error.message
+        assert expect_substr in error.message
 
-    def test_retry_with_backoff_success(self):
+    def test_retry_with_backoff_success(self, fresh_handler):
         """리트라이 성공 테스트"""
-        handler = ErrorHandler()
-        
         call_count = 0
         def test_func():
             nonlocal call_count
@@ -129,7 +109,7 @@ class TestErrorHandler:
                 raise ConnectionError("Test connection error")
             return "success"
         
-        result = handler.retry_with_backoff(
+        result = fresh_handler.retry_with_backoff(
             test_func,
             error_types=[ErrorType.NETWORK_ERROR]
         )
@@ -137,40 +117,34 @@ class TestErrorHandler:
         assert result == "success"
         assert call_count == 2
 
-    def test_retry_with_backoff_max_attempts(self):
+    def test_retry_with_backoff_max_attempts(self, fresh_handler):
         """리트라이 최대 시도 횟수 초과 테스트"""
-        handler = ErrorHandler()
-        
         def failing_func():
             raise ConnectionError("Test connection error")
         
         with pytest.raises(StandardError):
-            handler.retry_with_backoff(
+            fresh_handler.retry_with_backoff(
                 failing_func,
                 error_types=[ErrorType.NETWORK_ERROR]
             )
 
-    def test_retry_with_backoff_non_retryable_error(self):
+    def test_retry_with_backoff_non_retryable_error(self, fresh_handler):
         """리트라이 불가능한 에러 테스트"""
-        handler = ErrorHandler()
-        
         def failing_func():
             raise ValueError("Test validation error")
         
         with pytest.raises(StandardError):
-            handler.retry_with_backoff(
+            fresh_handler.retry_with_backoff(
                 failing_func,
                 error_types=[ErrorType.NETWORK_ERROR]  # ValueError는 리트라이하지 않음
             )
 
-    def test_get_error_summary(self):
+    def test_get_error_summary(self, handler):
         """에러 요약 테스트"""
-        handler = ErrorHandler()
-        
         errors = [
-            handler.create_error(ErrorType.VALIDATION_ERROR, "Error 1"),
-            handler.create_error(ErrorType.DATABASE_ERROR, "Error 2"),
-            handler.create_error(ErrorType.VALIDATION_ERROR, "Error 3"),
+            StandardError(ErrorType.VALIDATION_ERROR, "Error 1"),
+            StandardError(ErrorType.DATABASE_ERROR, "Error 2"),
+            StandardError(ErrorType.VALIDATION_ERROR, "Error 3"),
         ]
         
         summary = handler.get_error_summary(errors)
@@ -180,6 +154,16 @@ class TestErrorHandler:
         assert summary["error_type_counts"]["database_error"] == 1
         assert summary["most_common_error"] == "validation_error"
 
+    def test_get_error_summary_empty(self, handler):
+        """빈 에러 목록 요약 테스트"""
+        summary = handler.get_error_summary([])
+        
+        assert summary == {
+            "total_errors": 0,
+            "error_type_counts": {},
+            "most_common_error": None
+        }
+
 
 class TestDecorators:
     """데코레이터 테스트"""
@@ -204,8 +188,9 @@ class TestDecorators:
         
         assert exc_info.value.error_type == ErrorType.VALIDATION_ERROR
 
-    def test_retry_on_error_decorator_success(self):
+    def test_retry_on_error_decorator_success(self, mocker):
         """리트라이 데코레이터 성공 테스트"""
+        mocker.patch("infrastructure.error_handler.time.sleep")
         call_count = 0
         
         @retry_on_error(max_attempts=3, error_types=[ErrorType.NETWORK_ERROR])
@@ -220,8 +205,13 @@ class TestDecorators:
         assert result == "success"
         assert call_count == 2
 
-    def test_performance_monitor_decorator(self):
+    def test_performance_monitor_decorator(self, mocker):
         """성능 모니터링 데코레이터 테스트"""
+        # 실제 대기 없이 10ms 경과한 것으로 처리
+        mock_sleep = mocker.patch("time.sleep")
+        mock_clock = mocker.patch("infrastructure.decorators.time")
+        mock_clock.time.side_effect = [0.0, 0.01]
+
         @performance_monitor(operation_name="test_operation")
         def test_func():
             time.sleep(0.01)  # 10ms 지연
@@ -229,6 +219,8 @@ class TestDecorators:
         
         result = test_func()
         assert result == "success"
+        mock_sleep.assert_called_once_with(0.01)
+        assert mock_clock.time.call_count == 2
 
     def test_safe_execute_success(self):
         """안전한 실행 성공 테스트"""
@@ -262,26 +254,39 @@ class TestDecorators:
 class TestErrorTypes:
     """에러 타입 테스트"""
 
-    def test_error_type_enum(self):
+    @pytest.mark.parametrize(
+        "member,expected",
+        [
+            (ErrorType.VALIDATION_ERROR, "validation_error"),
+            (ErrorType.DATABASE_ERROR, "database_error"),
+            (ErrorType.LLM_ERROR, "llm_error"),
+        ],
+    )
+    def test_error_type_enum(self, member, expected):
         """에러 타입 열거형 테스트"""
-        assert ErrorType.VALIDATION_ERROR.value == "validation_error"
-        assert ErrorType.DATABASE_ERROR.value == "database_error"
-        assert ErrorType.LLM_ERROR.value == "llm_error"
-
-    def test_error_severity_enum(self):
+        assert member.value == expected
+
+    @pytest.mark.parametrize(
+        "member,expected",
+        [
+            (ErrorSeverity.LOW, "low"),
+            (ErrorSeverity.MEDIUM, "medium"),
+            (ErrorSeverity.HIGH, "high"),
+            (ErrorSeverity.CRITICAL, "critical"),
+        ],
+    )
+    def test_error_severity_enum(self, member, expected):
         """에러 심각도 열거형 테스트"""
-        assert ErrorSeverity.LOW.value == "low"
-        assert ErrorSeverity.MEDIUM.value == "medium"
-        assert ErrorSeverity.HIGH.value == "high"
-        assert ErrorSeverity.CRITICAL.value == "critical"
+        assert member.value == expected
 
 
 class TestStandardError:
     """표준 에러 테스트"""
 
-    def test_standard_error_creation(self):
-        """표준 에러 생성 테스트"""
-        error = StandardError(
+    @pytest.fixture(scope="module")
+    def sample_error(self):
+        """테스트들이 공유하는 표준 에러 (읽기 전용)"""
+        return StandardError(
             error_type=ErrorType.VALIDATION_ERROR,
             message="Test error",
             severity=ErrorSeverity.MEDIUM,
@@ -290,52 +295,36 @@ class TestStandardError:
             context={"operation": "test"},
             retryable=True
         )
-        
-        assert error.error_type == ErrorType.VALIDATION_ERROR
-        assert error.message == "Test error"
-        assert error.severity == ErrorSeverity.MEDIUM
-        assert error.error_code == "TEST_001"
-        assert error.details["field"] == "test"
-        assert error.context["operation"] == "test"
-        assert error.retryable is True
 
-    def test_standard_error_to_dict(self):
+    def test_standard_error_creation(self, sample_error):
+        """표준 에러 생성 테스트"""
+        assert sample_error.error_type == ErrorType.VALIDATION_ERROR
+        assert sample_error.message == "Test error"
+        assert sample_error.severity == ErrorSeverity.MEDIUM
+        assert sample_error.error_code == "TEST_001"
+        assert sample_error.details["field"] == "test"
+        assert sample_error.context["operation"] == "test"
+        assert sample_error.retryable is True
+
+    def test_standard_error_to_dict(self, sample_error):
         """표준 에러 딕셔너리 변환 테스트"""
-        error = StandardError(
-            error_type=ErrorType.VALIDATION_ERROR,
-            message="Test error",
-            severity=ErrorSeverity.MEDIUM
-        )
-        
-        error_dict = error.to_dict()
+        error_dict = sample_error.to_dict()
         
         assert error_dict["error_type"] == "validation_error"
         assert error_dict["message"] == "Test error"
         assert error_dict["severity"] == "medium"
         assert "timestamp" in error_dict
 
-    def test_standard_error_to_json(self):
+    def test_standard_error_to_json(self, sample_error):
         """표준 에러 JSON 변환 테스트"""
-        error = StandardError(
-            error_type=ErrorType.VALIDATION_ERROR,
-            message="Test error",
-            severity=ErrorSeverity.MEDIUM
-        )
-        
-        error_json = error.to_json()
+        error_json = sample_error.to_json()
         assert isinstance(error_json, str)
         assert "validation_error" in error_json
         assert "Test error" in error_json
 
-    def test_standard_error_str(self):
+    def test_standard_error_str(self, sample_error):
         """표준 에러 문자열 표현 테스트"""
-        error = StandardError(
-            error_type=ErrorType.VALIDATION_ERROR,
-            message="Test error",
-            error_code="TEST_001"
-        )
-        
-        error_str = str(error)
+        error_str = str(sample_error)
         assert "[validation_error] Test error (Code: TEST_001)" in error_str
 
 
@@ -402,6 +391,7 @@ class TestGlobalFunctions:
         
         result = retry_with_backoff(
             test_func,
+            retry_config=RetryConfig(base_delay=0.0, jitter=False),
             error_types=[ErrorType.NETWORK_ERROR]
         )
         
@@ -3,96 +3,136 @@ CSV→MySQL ETL 파이프라인 테스트
 TDD: 테스트 코드 먼저 작성
 """
 
-import os
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
-
+from data.etl_service import ETLService, ETLValidationError
+
+
+# 검증 테스트용 데이터 (모듈 로드 시 한 번만 생성, validate_data는 입력을 복사해 사용)
+NEGATIVE_SALES_DF = pd.DataFrame(
+    {
+        "region_name": ["강남구"],
+        "industry_name": ["음식점업"],
+        "date": ["2024-01-01"],
+        "sales_amount": [-1000000],
+        "transaction_count": [100],
+    }
+)
+
+INVALID_DATE_DF = pd.DataFrame(
+    {
+        "region_name": ["강남구"],
+        "industry_name": ["음식점업"],
+        "date": ["invalid_date"],
+        "sales_amount": [1000000],
+        "transaction_count": [100],
+    }
+)
+
+MISSING_VALUE_DF = pd.DataFrame(
+    {
+        "region_name": ["강남구", None, "서초구"],
+        "industry_name": ["음식점업", "소매업", None],
+        "date": ["2024-01-01", "2024-01-01", "2024-01-01"],
+        "sales_amount": [1000000, 2000000, 1500000],
+        "transaction_count": [100, 200, 150],
+    }
+)
+
+# 중복 제거 테스트용 데이터: 지역 5 x 업종 5 x 날짜 20 = 500개 고유 키를 두 번 반복한 1,000행
+_DUP_KEYS = pd.MultiIndex.from_product(
+    [
+        ["강남구", "서초구", "송파구", "마포구", "종로구"],
+        ["음식점업", "소매업", "숙박업", "카페", "미용업"],
+        pd.date_range("2024-01-01", periods=20).strftime("%Y-%m-%d"),
+    ],
+    names=["region_name", "industry_name", "date"],
+).to_frame(index=False)
+_DUP_KEYS["sales_amount"] = 1000000
+_DUP_KEYS["transaction_count"] = 100
+DUPLICATE_DF = pd.concat([_DUP_KEYS, _DUP_KEYS], ignore_index=True)
+DUPLICATE_KEY_COLUMNS = ["region_name", "industry_name", "date"]
+
+
+# DB 조회 모의 응답 (모듈 로드 시 한 번만 생성해 재사용)
+_REGION_DF = pd.DataFrame({"region_id": [1]})
+_INDUSTRY_DF = pd.DataFrame({"industry_id": [1]})
+_EMPTY_DF = pd.DataFrame()
+
+
+def _mock_execute_query(query, params=None):
+    """지역/업종 ID 조회에 고정 응답을 돌려주는 execute_query 대체 함수"""
+    return (
+        _REGION_DF
+        if "region_id" in query
+        else _INDUSTRY_DF if "industry_id" in query else _EMPTY_DF
+    )
+
+
+@pytest.fixture(scope="module")
+def etl_service():
+    """테스트들이 공유하는 ETL 서비스 (DB 관련 패치는 테스트마다 해제됨)"""
+    return ETLService()
+
+
+@pytest.fixture(scope="module")
+def sample_csv_bytes(sample_csv_data):
+    """샘플 데이터의 UTF-8 CSV 바이트 (모듈당 한 번만 직렬화/인코딩)"""
+    return sample_csv_data.to_csv(index=False).encode("utf-8")
+
+
+@pytest.fixture
+def sample_csv_path(tmp_path, sample_csv_bytes):
+    """샘플 CSV 파일 경로 (tmp_path는 pytest가 자동 정리)"""
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_bytes(sample_csv_bytes)
+    return str(csv_path)
+
+
+@pytest.fixture(scope="class")
+def _patched_db(etl_service):
+    """DB 조회/세션 패치를 클래스당 한 번만 설치"""
+    with (
+        patch.object(
+            etl_service.db_manager, "execute_query", side_effect=_mock_execute_query
+        ),
+        patch.object(etl_service.db_manager, "get_session") as mock_session,
+    ):
+        # Mock 세션 설정
+        mock_session.return_value.__enter__.return_value = MagicMock()
+        yield
+
+
+@pytest.mark.usefixtures("_patched_db")
 class TestETLService:
     """ETL 서비스 테스트"""
 
-    @pytest.fixture
-    def sample_csv_data(self):
-        """샘플 CSV 데이터 생성"""
-        return pd.DataFrame(
-            {
-                "region_name": ["강남구", "서초구", "송파구", "강남구", "서초구"],
-                "industry_name": ["음식점업", "소매업", "숙박업", "음식점업", "소매업"],
-                "date": pd.to_datetime(
-                    [
-                        "2024-01-01",
-                        "2024-01-01",
-                        "2024-01-01",
-                        "2024-01-02",
-                        "2024-01-02",
-                    ]
-                ),
-                "sales_amount": [1000000, 2000000, 1500000, 1200000, 1800000],
-                "transaction_count": [100, 200, 150, 120, 180],
-            }
-        )
-
-    @pytest.fixture
-    def sample_csv_with_issues(self):
-        """문제가 있는 샘플 CSV 데이터"""
-        return pd.DataFrame(
-            {
-                "region_name": ["강남구", "", "송파구", "강남구", None],
-                "industry_name": ["음식점업", "소매업", "", "음식점업", "소매업"],
-                "date": [
-                    "2024-01-01",
-                    "invalid_date",
-                    "2024-01-01",
-                    "2024-01-02",
-                    "2024-01-02",
-                ],
-                "sales_amount": [1000000, -500000, 1500000, 1200000, 1800000],
-                "transaction_count": [100, 200, 150, 120, 180],
-            }
-        )
-
-    def test_etl_service_initialization(self):
+    def test_etl_service_initialization(self, etl_service):
         """ETL 서비스 초기화 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
         assert etl_service is not None
         assert hasattr(etl_service, "db_manager")
 
-    def test_csv_loading(self, sample_csv_data):
+    def test_csv_loading(self, etl_service, sample_csv_path):
         """CSV 로딩 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 임시 CSV 파일 생성
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            sample_csv_data.to_csv(f.name, index=False, encoding="utf-8")
-            temp_file = f.name
-
-        try:
-            # CSV 로딩 테스트
-            loaded_data = etl_service.load_csv(temp_file)
-
-            assert isinstance(loaded_data, pd.DataFrame)
-            assert len(loaded_data) == 5
-            assert "region_name" in loaded_data.columns
-            assert "industry_name" in loaded_data.columns
-            assert "date" in loaded_data.columns
-            assert "sales_amount" in loaded_data.columns
-        finally:
-            os.unlink(temp_file)
-
-    def test_data_validation(self, sample_csv_data):
+        # CSV 로딩 테스트
+        loaded_data = etl_service.load_csv(sample_csv_path)
+
+        assert isinstance(loaded_data, pd.DataFrame)
+        assert loaded_data.shape == (5, 5)
+        assert list(loaded_data.columns) == [
+            "region_name",
+            "industry_name",
+            "date",
+            "sales_amount",
+            "transaction_count",
+        ]
+
+    def test_data_validation(self, etl_service, sample_csv_data):
         """데이터 검증 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
         # 정상 데이터 검증
         validated_data = etl_service.validate_data(sample_csv_data)
         assert len(validated_data) == 5
@@ -113,63 +153,32 @@ class TestETLService:
         # 문제가 있는 행들이 제거되어야 함
         assert len(validated_problem_data) < len(problem_data)
 
-    def test_duplicate_removal(self):
+    def test_duplicate_removal(self, etl_service):
         """중복 제거 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 중복 데이터 생성
-        duplicate_data = pd.DataFrame(
-            {
-                "region_name": ["강남구", "강남구", "서초구", "강남구"],
-                "industry_name": ["음식점업", "음식점업", "소매업", "음식점업"],
-                "date": ["2024-01-01", "2024-01-01", "2024-01-01", "2024-01-01"],
-                "sales_amount": [1000000, 1000000, 2000000, 1000000],
-                "transaction_count": [100, 100, 200, 100],
-            }
-        )
+        expected_len = DUPLICATE_DF.drop_duplicates(subset=DUPLICATE_KEY_COLUMNS).shape[0]
 
-        cleaned_data = etl_service.remove_duplicates(duplicate_data)
-        assert len(cleaned_data) == 2  # 중복 제거 후 2개 행만 남아야 함
+        cleaned_data = etl_service.remove_duplicates(DUPLICATE_DF)
+        assert cleaned_data.shape[0] == expected_len == 500  # 중복 제거 후 고유 키 500행만 남아야 함
 
-    def test_data_transformation(self, sample_csv_data):
+    def test_data_transformation(self, etl_service, sample_csv_data):
         """데이터 변환 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
+        transformed_data = etl_service.transform_data(sample_csv_data)
 
-        # Mock 데이터베이스 매니저
-        def mock_execute_query(query, params=None):
-            if "region_id" in query:
-                return pd.DataFrame({"region_id": [1]})
-            elif "industry_id" in query:
-                return pd.DataFrame({"industry_id": [1]})
-            else:
-                return pd.DataFrame()
-
-        with patch.object(
-            etl_service.db_manager, "execute_query", side_effect=mock_execute_query
-        ):
-            transformed_data = etl_service.transform_data(sample_csv_data)
-
-            # 변환된 데이터 검증
-            assert "region_id" in transformed_data.columns
-            assert "industry_id" in transformed_data.columns
-            assert "avg_transaction_amount" in transformed_data.columns
-
-            # 평균 거래 금액 계산 검증
-            expected_avg = (
-                transformed_data["sales_amount"] / transformed_data["transaction_count"]
-            )
-            assert np.allclose(transformed_data["avg_transaction_amount"], expected_avg)
-
-    def test_region_industry_mapping(self):
-        """지역/업종 매핑 테스트"""
-        from data.etl_service import ETLService
+        # 변환된 데이터 검증
+        assert {"region_id", "industry_id", "avg_transaction_amount"}.issubset(
+            transformed_data.columns
+        )
 
-        etl_service = ETLService()
+        # 평균 거래 금액 계산 검증
+        expected_avg = (
+            transformed_data["sales_amount"] / transformed_data["transaction_count"]
+        )
+        np.testing.assert_array_equal(
+            transformed_data["avg_transaction_amount"].to_numpy(), expected_avg.to_numpy()
+        )
 
+    def test_region_industry_mapping(self, etl_service):
+        """지역/업종 매핑 테스트"""
         # Mock 데이터베이스 매니저
         with patch.object(etl_service.db_manager, "execute_query") as mock_query:
             # 지역 ID 조회 Mock 응답 설정
@@ -184,83 +193,23 @@ class TestETLService:
             industry_id = etl_service.get_industry_id("음식점업")
             assert industry_id == 1
 
-    def test_data_loading_to_database(self, sample_csv_data):
+    def test_data_loading_to_database(self, etl_service, sample_csv_data):
         """데이터베이스 로딩 테스트"""
-        from data.etl_service import ETLService
+        # 변환된 데이터 생성
+        transformed_data = etl_service.transform_data(sample_csv_data)
 
-        etl_service = ETLService()
+        # 데이터베이스 로딩 테스트
+        result = etl_service.load_to_database(transformed_data)
+        assert result is True
 
-        # Mock 데이터베이스 매니저
-        def mock_execute_query(query, params=None):
-            if "region_id" in query:
-                return pd.DataFrame({"region_id": [1]})
-            elif "industry_id" in query:
-                return pd.DataFrame({"industry_id": [1]})
-            else:
-                return pd.DataFrame()
-
-        with (
-            patch.object(
-                etl_service.db_manager, "execute_query", side_effect=mock_execute_query
-            ),
-            patch.object(etl_service.db_manager, "get_session") as mock_session,
-        ):
-
-            # Mock 세션 설정
-            mock_session.return_value.__enter__.return_value = MagicMock()
-
-            # 변환된 데이터 생성
-            transformed_data = etl_service.transform_data(sample_csv_data)
-
-            # 데이터베이스 로딩 테스트
-            result = etl_service.load_to_database(transformed_data)
-            assert result is True
-
-    def test_etl_pipeline_full_flow(self, sample_csv_data):
+    def test_etl_pipeline_full_flow(self, etl_service, sample_csv_path):
         """ETL 파이프라인 전체 플로우 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 임시 CSV 파일 생성
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            sample_csv_data.to_csv(f.name, index=False, encoding="utf-8")
-            temp_file = f.name
-
-        try:
-            # Mock 데이터베이스 매니저
-            def mock_execute_query(query, params=None):
-                if "region_id" in query:
-                    return pd.DataFrame({"region_id": [1]})
-                elif "industry_id" in query:
-                    return pd.DataFrame({"industry_id": [1]})
-                else:
-                    return pd.DataFrame()
-
-            with (
-                patch.object(
-                    etl_service.db_manager,
-                    "execute_query",
-                    side_effect=mock_execute_query,
-                ),
-                patch.object(etl_service.db_manager, "get_session") as mock_session,
-            ):
-
-                # Mock 세션 설정
-                mock_session.return_value.__enter__.return_value = MagicMock()
-
-                # 전체 ETL 파이프라인 실행
-                result = etl_service.run_etl_pipeline(temp_file)
-                assert result is True
-        finally:
-            os.unlink(temp_file)
-
-    def test_error_handling(self):
-        """에러 처리 테스트"""
-        from data.etl_service import ETLService, ETLValidationError
-
-        etl_service = ETLService()
+        # 전체 ETL 파이프라인 실행
+        result = etl_service.run_etl_pipeline(sample_csv_path)
+        assert result is True
 
+    def test_error_handling(self, etl_service):
+        """에러 처리 테스트"""
         # 존재하지 않는 파일 로딩 테스트
         with pytest.raises(ETLValidationError):
             etl_service.load_csv("nonexistent_file.csv")
@@ -271,12 +220,8 @@ class TestETLService:
         with pytest.raises(ETLValidationError):
             etl_service.validate_data(invalid_data)
 
-    def test_logging_functionality(self, sample_csv_data):
+    def test_logging_functionality(self, etl_service, sample_csv_data):
         """로깅 기능 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
         # Mock 로거
         with patch("data.etl_service.logger") as mock_logger:
             etl_service.validate_data(sample_csv_data)
@@ -288,66 +233,19 @@ class TestETLService:
 class TestDataValidation:
     """데이터 검증 테스트"""
 
-    def test_sales_amount_validation(self):
-        """매출 금액 검증 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 음수 매출 테스트
-        negative_sales_data = pd.DataFrame(
-            {
-                "region_name": ["강남구"],
-                "industry_name": ["음식점업"],
-                "date": ["2024-01-01"],
-                "sales_amount": [-1000000],
-                "transaction_count": [100],
-            }
-        )
-
-        validated_data = etl_service.validate_data(negative_sales_data)
-        assert len(validated_data) == 0  # 음수 매출은 제거되어야 함
-
-    def test_date_validation(self):
-        """날짜 검증 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 잘못된 날짜 형식 테스트
-        invalid_date_data = pd.DataFrame(
-            {
-                "region_name": ["강남구"],
-                "industry_name": ["음식점업"],
-                "date": ["invalid_date"],
-                "sales_amount": [1000000],
-                "transaction_count": [100],
-            }
-        )
-
-        validated_data = etl_service.validate_data(invalid_date_data)
-        assert len(validated_data) == 0  # 잘못된 날짜는 제거되어야 함
-
-    def test_missing_value_handling(self):
-        """결측값 처리 테스트"""
-        from data.etl_service import ETLService
-
-        etl_service = ETLService()
-
-        # 결측값이 있는 데이터
-        missing_data = pd.DataFrame(
-            {
-                "region_name": ["강남구", None, "서초구"],
-                "industry_name": ["음식점업", "소매업", None],
-                "date": ["2024-01-01", "2024-01-01", "2024-01-01"],
-                "sales_amount": [1000000, 2000000, 1500000],
-                "transaction_count": [100, 200, 150],
-            }
-        )
-
-        validated_data = etl_service.validate_data(missing_data)
-        # 결측값이 있는 행들이 제거되어야 함
-        assert len(validated_data) < len(missing_data)
+    @pytest.mark.parametrize(
+        "bad_df, expected_len",
+        [
+            (NEGATIVE_SALES_DF, 0),  # 음수 매출은 제거되어야 함
+            (INVALID_DATE_DF, 0),  # 잘못된 날짜는 제거되어야 함
+            (MISSING_VALUE_DF, 1),  # 결측값이 있는 행들이 제거되어야 함
+        ],
+        ids=["negative_sales", "invalid_date", "missing_value"],
+    )
+    def test_validate_data_drops_bad_rows(self, etl_service, bad_df, expected_len):
+        """매출 금액/날짜/결측값 검증 테스트"""
+        validated_data = etl_service.validate_data(bad_df)
+        assert len(validated_data) == expected_len
 
 
 if __name__ == "__main__":
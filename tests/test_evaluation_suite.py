@@ -5,67 +5,95 @@ TASK-016: 평가 스위트 - 정확도/각주율/지연 벤치
 
 import pytest
 import time
-from unittest.mock import MagicMock, patch
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
 from pathlib import Path
 
 from pipelines.eval_suite import EvaluationSuite
 
+# 고품질 보고서용 긴 섹션 본문 (모듈 로드 시 한 번만 생성)
+_LONG_SUMMARY = "요약 내용" * 100
+_LONG_QUANTITATIVE = "정량 분석" * 100
+_LONG_QUALITATIVE = "정성 분석" * 100
+_LONG_INSIGHTS = "인사이트" * 100
+
+# 백분위수 계산 입력 (1~10)
+_PCTL_DATA = list(range(1, 11))
+
+
+# 보고서 생성 테스트용 평가 결과 (generate_evaluation_report는 입력을 읽기만 함)
+_MOCK_RESULTS = {
+    "evaluation_timestamp": "2024-01-01T00:00:00",
+    "total_evaluation_time": 10.5,
+    "overall_metrics": {
+        "kpi_performance": {
+            "sql_accuracy_achieved": 0.95,
+            "sql_accuracy_target": 0.90,
+            "sql_accuracy_status": "PASS",
+            "response_time_achieved": 2.5,
+            "response_time_target": 3.0,
+            "response_time_status": "PASS",
+            "evidence_citation_achieved": 0.85,
+            "evidence_citation_target": 0.80,
+            "evidence_citation_status": "PASS"
+        }
+    },
+    "components": {
+        "text_to_sql": {
+            "accuracy": 0.95,
+            "avg_response_time": 1.5,
+            "p95_response_time": 2.0,
+            "successful_queries": 19,
+            "total_queries": 20
+        },
+        "rag": {
+            "avg_relevance_score": 0.85,
+            "avg_response_time": 0.8,
+            "p95_response_time": 1.2
+        },
+        "report_generation": {
+            "success_rate": 1.0,
+            "avg_quality_score": 0.85,
+            "avg_generation_time": 3.0
+        }
+    }
+}
+
+
+def _fake_clock(values):
+    """주어진 값을 순서대로 돌려주는 time 모듈 대체 객체 (MagicMock 없이 결정적 시간)"""
+    it = iter(values)
+    return SimpleNamespace(time=lambda: next(it))
+
+
+class _FixedDatetime:
+    """항상 2024-01-01 00:00:00을 돌려주는 datetime 대체 클래스"""
+
+    @staticmethod
+    def now():
+        return datetime(2024, 1, 1, 0, 0, 0)
+
 
 class TestEvaluationSuite:
     """평가 스위트 테스트 클래스"""
 
+    @pytest.fixture(scope="module")
+    def results_dir(self, tmp_path_factory):
+        """평가 결과 저장 경로 (xdist 워커별 임시 디렉터리라 파일명 충돌 없음)"""
+        return tmp_path_factory.mktemp("evaluation")
+
     @pytest.fixture
-    def eval_suite(self):
+    def eval_suite(self, results_dir):
         """평가 스위트 인스턴스 생성"""
         config = {
-            "results_path": "test_models/artifacts/evaluation"
+            "results_path": str(results_dir)
         }
         return EvaluationSuite(config)
 
-    @pytest.fixture
-    def mock_sql_engine(self):
-        """Mock SQL 엔진 생성"""
-        engine = MagicMock()
-        engine.query.return_value = {
-            "success": True,
-            "sql_query": "SELECT * FROM regions WHERE name = '강남구'",
-            "data": [{"name": "강남구", "sales": 1000000}]
-        }
-        return engine
-
-    @pytest.fixture
-    def mock_rag_engine(self):
-        """Mock RAG 엔진 생성"""
-        engine = MagicMock()
-        engine.search.return_value = [
-            {
-                "text": "강남구는 IT와 금융업이 발달한 지역입니다.",
-                "combined_score": 0.85,
-                "vector_score": 0.8,
-                "bm25_score": 0.9,
-                "metadata": {"source": "강남구_정책문서.pdf"}
-            }
-        ]
-        return engine
-
-    @pytest.fixture
-    def mock_report_generator(self):
-        """Mock 보고서 생성기 생성"""
-        generator = MagicMock()
-        generator.generate_full_report.return_value = {
-            "executive_summary": "강남구는 서울의 핵심 상권입니다.",
-            "quantitative_analysis": "매출 데이터 분석 결과...",
-            "qualitative_analysis": "정책 문서 분석 결과...",
-            "insights_recommendations": "개선 방안 제시...",
-            "data_sources": {
-                "qualitative": ["강남구_정책문서.pdf", "스타트업_지원정책.pdf"]
-            }
-        }
-        return generator
-
-    def test_evaluation_suite_initialization(self, eval_suite):
+    def test_evaluation_suite_initialization(self, eval_suite, results_dir):
         """평가 스위트 초기화 테스트"""
-        assert eval_suite.config["results_path"] == "test_models/artifacts/evaluation"
+        assert eval_suite.config["results_path"] == str(results_dir)
         assert eval_suite.evaluation_results == {}
         assert eval_suite.performance_metrics == {}
         assert eval_suite.results_path.exists()
@@ -80,7 +108,7 @@ class TestEvaluationSuite:
             }
         ]
 
-        with patch('time.time', side_effect=[0, 0.5]):  # Mock time for consistent testing
+        with patch("pipelines.eval_suite.time", _fake_clock([0, 0.5])):  # Mock time for consistent testing
             results = eval_suite.evaluate_text_to_sql_accuracy(mock_sql_engine, test_queries)
 
         assert results["total_queries"] == 1
@@ -96,14 +124,8 @@ class TestEvaluationSuite:
         assert query_result["response_time"] == 0.5
         assert "SELECT" in query_result["sql_query"]
 
-    def test_evaluate_text_to_sql_accuracy_with_failure(self, eval_suite):
+    def test_evaluate_text_to_sql_accuracy_with_failure(self, eval_suite, failing_sql_engine):
         """Text-to-SQL 정확도 평가 실패 케이스 테스트"""
-        mock_engine = MagicMock()
-        mock_engine.query.return_value = {
-            "success": False,
-            "error": "SQL syntax error"
-        }
-
         test_queries = [
             {
                 "query": "잘못된 쿼리",
@@ -112,8 +134,8 @@ class TestEvaluationSuite:
             }
         ]
 
-        with patch('time.time', side_effect=[0, 0.2]):
-            results = eval_suite.evaluate_text_to_sql_accuracy(mock_engine, test_queries)
+        with patch("pipelines.eval_suite.time", _fake_clock([0, 0.2])):
+            results = eval_suite.evaluate_text_to_sql_accuracy(failing_sql_engine, test_queries)
 
         assert results["total_queries"] == 1
         assert results["successful_queries"] == 0
@@ -130,7 +152,7 @@ class TestEvaluationSuite:
             }
         ]
 
-        with patch('time.time', side_effect=[0, 0.3]):
+        with patch("pipelines.eval_suite.time", _fake_clock([0, 0.3])):
             results = eval_suite.evaluate_rag_quality(mock_rag_engine, test_queries)
 
         assert results["total_queries"] == 1
@@ -154,7 +176,7 @@ class TestEvaluationSuite:
             }
         ]
 
-        with patch('time.time', side_effect=[0, 2.0]):
+        with patch("pipelines.eval_suite.time", _fake_clock([0, 2.0])):
             results = eval_suite.evaluate_report_generation(mock_report_generator, test_configs)
 
         assert results["total_configs"] == 1
@@ -171,10 +193,8 @@ class TestEvaluationSuite:
 
     def test_calculate_percentile(self, eval_suite):
         """백분위수 계산 테스트"""
-        data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        
-        assert eval_suite._calculate_percentile(data, 50) == 5  # median
-        assert eval_suite._calculate_percentile(data, 95) == 10  # p95
+        assert eval_suite._calculate_percentile(_PCTL_DATA, 50) == 5  # median
+        assert eval_suite._calculate_percentile(_PCTL_DATA, 95) == 10  # p95
         assert eval_suite._calculate_percentile([], 50) == 0.0  # empty data
 
     def test_calculate_relevance_score(self, eval_suite):
@@ -212,10 +232,10 @@ class TestEvaluationSuite:
         """보고서 품질 점수 계산 테스트"""
         # High quality report
         high_quality_report = {
-            "executive_summary": "요약 내용" * 100,  # Long content
-            "quantitative_analysis": "정량 분석" * 100,
-            "qualitative_analysis": "정성 분석" * 100,
-            "insights_recommendations": "인사이트" * 100,
+            "executive_summary": _LONG_SUMMARY,  # Long content
+            "quantitative_analysis": _LONG_QUANTITATIVE,
+            "qualitative_analysis": _LONG_QUALITATIVE,
+            "insights_recommendations": _LONG_INSIGHTS,
             "data_sources": {
                 "qualitative": ["doc1.pdf", "doc2.pdf", "doc3.pdf", "doc4.pdf", "doc5.pdf"]
             }
@@ -233,7 +253,7 @@ class TestEvaluationSuite:
 
     def test_run_comprehensive_evaluation(self, eval_suite, mock_sql_engine, mock_rag_engine, mock_report_generator):
         """종합 평가 실행 테스트"""
-        with patch('time.time', side_effect=[0, 0.5, 1.0, 1.5, 2.0]):  # Mock evaluation time
+        with patch("pipelines.eval_suite.time", _fake_clock([0, 0.5, 1.0, 1.5, 2.0])):  # Mock evaluation time
             results = eval_suite.run_comprehensive_evaluation(
                 sql_engine=mock_sql_engine,
                 rag_engine=mock_rag_engine,
@@ -260,44 +280,7 @@ class TestEvaluationSuite:
 
     def test_generate_evaluation_report(self, eval_suite):
         """평가 보고서 생성 테스트"""
-        mock_results = {
-            "evaluation_timestamp": "2024-01-01T00:00:00",
-            "total_evaluation_time": 10.5,
-            "overall_metrics": {
-                "kpi_performance": {
-                    "sql_accuracy_achieved": 0.95,
-                    "sql_accuracy_target": 0.90,
-                    "sql_accuracy_status": "PASS",
-                    "response_time_achieved": 2.5,
-                    "response_time_target": 3.0,
-                    "response_time_status": "PASS",
-                    "evidence_citation_achieved": 0.85,
-                    "evidence_citation_target": 0.80,
-                    "evidence_citation_status": "PASS"
-                }
-            },
-            "components": {
-                "text_to_sql": {
-                    "accuracy": 0.95,
-                    "avg_response_time": 1.5,
-                    "p95_response_time": 2.0,
-                    "successful_queries": 19,
-                    "total_queries": 20
-                },
-                "rag": {
-                    "avg_relevance_score": 0.85,
-                    "avg_response_time": 0.8,
-                    "p95_response_time": 1.2
-                },
-                "report_generation": {
-                    "success_rate": 1.0,
-                    "avg_quality_score": 0.85,
-                    "avg_generation_time": 3.0
-                }
-            }
-        }
-
-        report = eval_suite.generate_evaluation_report(mock_results)
+        report = eval_suite.generate_evaluation_report(_MOCK_RESULTS)
         
         assert "# 시스템 평가 보고서" in report
         assert "KPI 성과" in report
@@ -315,17 +298,13 @@ class TestEvaluationSuite:
             "overall_metrics": {}
         }
 
-        # Mock datetime to get consistent filename
-        with patch('pipelines.eval_suite.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "20240101_000000"
+        # Freeze datetime to get consistent filename
+        with patch("pipelines.eval_suite.datetime", _FixedDatetime):
             eval_suite._save_evaluation_results(test_results)
 
-        # Check if file was created
+        # Check if file was created (임시 디렉터리는 pytest가 자동 정리)
         expected_file = eval_suite.results_path / "evaluation_results_20240101_000000.json"
-        assert expected_file.exists()
-
-        # Clean up
-        expected_file.unlink()
+        assert expected_file.stat().st_size > 0
 
     def test_get_test_queries(self, eval_suite):
         """테스트 쿼리 반환 테스트"""
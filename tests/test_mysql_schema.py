@@ -4,10 +4,69 @@ TDD: 테스트 코드 먼저 작성
 """
 
 import os
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+# 대소문자 그대로 찾는 컬럼명/구문
+_RAW_KEYWORDS = (
+    "region_id",
+    "region_name",
+    "created_at",
+    "industry_id",
+    "industry_name",
+    "date",
+    "sales_amount",
+    ";",
+)
+
+# 대소문자 구분 없이 찾는 SQL 키워드
+_SQL_KEYWORDS = (
+    "CREATE TABLE IF NOT EXISTS REGIONS",
+    "CREATE TABLE IF NOT EXISTS INDUSTRIES",
+    "CREATE TABLE IF NOT EXISTS SALES_2024",
+    "CREATE TABLE",
+    "PRIMARY KEY",
+    "FOREIGN KEY",
+    "INDEX",
+    "INT",
+    "VARCHAR",
+    "DECIMAL",
+    "FLOAT",
+    "DATETIME",
+    "DATE",
+)
+
+
+def _keyword_pattern(keywords, flags=0):
+    """바이트 키워드 교대 패턴 컴파일 (긴 키워드 우선, 전방 탐색으로 겹친 위치도 검사)"""
+    encoded = sorted((kw.encode() for kw in keywords), key=len, reverse=True)
+    return re.compile(b"(?=(" + b"|".join(map(re.escape, encoded)) + b"))", flags)
+
+
+_RAW_PATTERN = _keyword_pattern(_RAW_KEYWORDS)
+_SQL_PATTERN = _keyword_pattern(_SQL_KEYWORDS, re.IGNORECASE)
+
+
+def _scan_keywords(pattern, keywords, buffer, normalize=bytes.decode):
+    """한 번의 정규식 스캔으로 버퍼에 등장하는 키워드 집합 계산"""
+    # 스키마 전체가 아니라 일치한 짧은 키워드만 디코딩
+    matched = {normalize(m.group(1)) for m in pattern.finditer(buffer)}
+    # 같은 위치에서 더 긴 키워드가 선택되면 그 안에 포함된 키워드도 등장한 것
+    return {kw for kw in keywords if any(kw in hit for hit in matched)}
+
+
+@pytest.fixture(scope="module")
+def schema_hits(schema_mmap):
+    """스키마에 등장하는 키워드 집합 (모듈당 한 번만 검사)"""
+    hits = _scan_keywords(_RAW_PATTERN, _RAW_KEYWORDS, schema_mmap)
+    # SQL 키워드는 ASCII이므로 바이트 단계에서 대문자로 맞춘 뒤 디코딩
+    hits |= _scan_keywords(
+        _SQL_PATTERN, _SQL_KEYWORDS, schema_mmap, lambda b: b.upper().decode()
+    )
+    return frozenset(hits)
+
 
 class TestMySQLSchema:
     """MySQL 스키마 테스트"""
@@ -29,138 +88,91 @@ class TestMySQLSchema:
             schema_path
         ), "스키마 파일 data/schema.sql이 존재하지 않습니다"
 
-    def test_schema_contains_required_tables(self):
+    def test_schema_contains_required_tables(self, schema_hits):
         """스키마에 필수 테이블들이 포함되어 있는지 확인"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
-        required_tables = ["regions", "industries", "sales_2024"]
+        required_tables = ["REGIONS", "INDUSTRIES", "SALES_2024"]
         for table in required_tables:
             assert (
-                f"CREATE TABLE IF NOT EXISTS {table}".upper() in schema_content.upper()
-            ), f"테이블 {table}이 스키마에 없습니다"
-
-    def test_regions_table_structure(self):
-        """regions 테이블 구조 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
-        # regions 테이블에 필수 컬럼들이 있는지 확인
-        required_columns = ["region_id", "region_name", "created_at"]
-        for column in required_columns:
-            assert (
-                column in schema_content
-            ), f"regions 테이블에 컬럼 {column}이 없습니다"
-
-    def test_industries_table_structure(self):
-        """industries 테이블 구조 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
-        # industries 테이블에 필수 컬럼들이 있는지 확인
-        required_columns = ["industry_id", "industry_name", "created_at"]
-        for column in required_columns:
-            assert (
-                column in schema_content
-            ), f"industries 테이블에 컬럼 {column}이 없습니다"
-
-    def test_sales_2024_table_structure(self):
-        """sales_2024 테이블 구조 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
-        # sales_2024 테이블에 필수 컬럼들이 있는지 확인
-        required_columns = ["region_id", "industry_id", "date", "sales_amount"]
-        for column in required_columns:
-            assert (
-                column in schema_content
-            ), f"sales_2024 테이블에 컬럼 {column}이 없습니다"
-
-    def test_composite_primary_key(self):
+                f"CREATE TABLE IF NOT EXISTS {table}" in schema_hits
+            ), f"테이블 {table.lower()}이 스키마에 없습니다"
+
+    @pytest.mark.parametrize(
+        "table, required_columns",
+        [
+            ("regions", ("region_id", "region_name", "created_at")),
+            ("industries", ("industry_id", "industry_name", "created_at")),
+            ("sales_2024", ("region_id", "industry_id", "date", "sales_amount")),
+        ],
+    )
+    def test_table_structure(self, schema_hits, table, required_columns):
+        """테이블별 필수 컬럼 구조 검증"""
+        missing = [column for column in required_columns if column not in schema_hits]
+        assert not missing, f"{table} 테이블에 컬럼 {missing}이 없습니다"
+
+    def test_composite_primary_key(self, schema_hits):
         """복합 기본키 설정 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
         # sales_2024 테이블에 복합 기본키가 설정되어 있는지 확인
         assert (
-            "PRIMARY KEY" in schema_content.upper()
+            "PRIMARY KEY" in schema_hits
         ), "복합 기본키가 설정되지 않았습니다"
         assert (
-            "region_id" in schema_content and "industry_id" in schema_content
+            "region_id" in schema_hits and "industry_id" in schema_hits
         ), "복합 기본키에 필수 컬럼이 없습니다"
 
-    def test_indexes_defined(self):
+    def test_indexes_defined(self, schema_hits):
         """인덱스 정의 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
         # 보조 인덱스들이 정의되어 있는지 확인
         required_indexes = ["date", "region", "industry"]
         for index in required_indexes:
             assert (
-                "INDEX" in schema_content.upper()
+                "INDEX" in schema_hits
             ), f"인덱스 {index}가 정의되지 않았습니다"
 
-    def test_foreign_key_constraints(self):
+    def test_foreign_key_constraints(self, schema_hits):
         """외래키 제약조건 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
         # 외래키 제약조건이 설정되어 있는지 확인
         assert (
-            "FOREIGN KEY" in schema_content.upper()
+            "FOREIGN KEY" in schema_hits
         ), "외래키 제약조건이 설정되지 않았습니다"
 
-    def test_schema_syntax_valid(self, mock_db_connection):
+    def test_schema_syntax_valid(self, mock_db_connection, schema_hits):
         """스키마 문법 유효성 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
         # SQL 문법이 유효한지 확인 (기본적인 검증)
-        assert "CREATE TABLE" in schema_content.upper(), "CREATE TABLE 문이 없습니다"
-        assert ";" in schema_content, "SQL 문이 세미콜론으로 종료되지 않았습니다"
+        assert "CREATE TABLE" in schema_hits, "CREATE TABLE 문이 없습니다"
+        assert ";" in schema_hits, "SQL 문이 세미콜론으로 종료되지 않았습니다"
 
-    def test_data_types_appropriate(self):
+    def test_data_types_appropriate(self, schema_hits):
         """데이터 타입 적절성 검증"""
-        schema_path = "data/schema.sql"
-        with open(schema_path, encoding="utf-8") as f:
-            schema_content = f.read()
-
         # 적절한 데이터 타입이 사용되었는지 확인
-        assert "INT" in schema_content.upper(), "INT 타입이 사용되지 않았습니다"
-        assert "VARCHAR" in schema_content.upper(), "VARCHAR 타입이 사용되지 않았습니다"
+        assert "INT" in schema_hits, "INT 타입이 사용되지 않았습니다"
+        assert "VARCHAR" in schema_hits, "VARCHAR 타입이 사용되지 않았습니다"
         assert (
-            "DECIMAL" in schema_content.upper() or "FLOAT" in schema_content.upper()
+            "DECIMAL" in schema_hits or "FLOAT" in schema_hits
         ), "숫자 타입이 사용되지 않았습니다"
         assert (
-            "DATE" in schema_content.upper() or "DATETIME" in schema_content.upper()
+            "DATE" in schema_hits or "DATETIME" in schema_hits
         ), "날짜 타입이 사용되지 않았습니다"
 
 
+@pytest.fixture(scope="module")
+def db_config():
+    """모듈에서 공유하는 데이터베이스 설정 (설정 파싱은 한 번만 수행)"""
+    from config import DatabaseConfig
+
+    return DatabaseConfig()
+
+
 class TestDatabaseConnection:
     """데이터베이스 연결 테스트"""
 
-    def test_database_config_loaded(self):
+    def test_database_config_loaded(self, db_config):
         """데이터베이스 설정이 로드되는지 확인"""
-        from config import DatabaseConfig
-
-        # 설정 클래스가 존재하는지 확인
-        assert DatabaseConfig is not None, "DatabaseConfig 클래스가 정의되지 않았습니다"
+        # 설정 클래스가 정의되어 인스턴스가 생성되는지 확인
+        assert db_config is not None, "DatabaseConfig 클래스가 정의되지 않았습니다"
 
-    def test_connection_string_format(self):
+    def test_connection_string_format(self, db_config):
         """연결 문자열 형식 검증"""
-        from config import DatabaseConfig
-
-        config = DatabaseConfig()
-        connection_string = config.get_connection_string()
+        connection_string = db_config.get_connection_string()
 
         # 연결 문자열에 필수 요소들이 포함되어 있는지 확인
         assert (
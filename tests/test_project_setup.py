@@ -3,11 +3,29 @@
 TDD: 테스트 코드 먼저 작성
 """
 
+import importlib
 import os
+import re
 import sys
+from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
+
+
+@pytest.fixture(scope="module")
+def requirements_text():
+    """requirements.txt 내용 (모듈당 한 번만 읽음)"""
+    return Path("requirements.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def requirements_pkgs(requirements_text):
+    """requirements.txt의 패키지명 집합 (버전/extras/마커 제거, 소문자)"""
+    return {
+        re.split(r"[<>=!~\[;\s]", line.strip(), maxsplit=1)[0].lower()
+        for line in requirements_text.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    }
 
 
 class TestProjectStructure:
@@ -37,17 +55,14 @@ class TestProjectStructure:
         for file_name in required_files:
             assert os.path.exists(file_name), f"파일 {file_name}이 존재하지 않습니다"
 
-    def test_requirements_txt_format(self):
+    def test_requirements_txt_format(self, requirements_text, requirements_pkgs):
         """requirements.txt 형식 검증"""
-        with open("requirements.txt", encoding="utf-8") as f:
-            content = f.read()
-
         # 버전 고정이 없어야 함 (최신 버전 설치)
-        assert ">=" not in content, "requirements.txt에 버전 고정이 있습니다"
-        assert "==" not in content, "requirements.txt에 버전 고정이 있습니다"
+        assert ">=" not in requirements_text, "requirements.txt에 버전 고정이 있습니다"
+        assert "==" not in requirements_text, "requirements.txt에 버전 고정이 있습니다"
 
-        # 필수 패키지들이 포함되어야 함
-        required_packages = [
+        # 필수 패키지들이 포함되어야 함 (패키지명 단위로 비교)
+        required_packages = {
             "streamlit",
             "pandas",
             "sqlalchemy",
@@ -59,10 +74,10 @@ class TestProjectStructure:
             "sentence-transformers",
             "chromadb",
             "pytest",
-        ]
+        }
 
-        for package in required_packages:
-            assert package in content, f"패키지 {package}이 requirements.txt에 없습니다"
+        missing = required_packages - requirements_pkgs
+        assert not missing, f"패키지 {sorted(missing)}이 requirements.txt에 없습니다"
 
 
 class TestEnvironmentSetup:
@@ -91,14 +106,10 @@ class TestEnvironmentSetup:
         for var in required_vars:
             assert var in content, f"환경변수 {var}이 env.example에 없습니다"
 
-    def test_env_loading(self):
+    def test_env_loading(self, env_example_values):
         """환경변수 로딩 테스트"""
-        # .env 파일이 없어도 에러가 발생하지 않아야 함
-        try:
-            load_dotenv("env.example")
-            assert True
-        except Exception as e:
-            pytest.fail(f"환경변수 로딩 실패: {e}")
+        # os.environ을 바꾸지 않고 세션 캐시된 파싱 결과만 확인
+        assert env_example_values, "env.example에서 환경변수를 읽지 못했습니다"
 
 
 class TestPythonVersion:
@@ -115,42 +126,41 @@ class TestPythonVersion:
         ), f"Python 3.12+가 필요합니다. 현재: {version.major}.{version.minor}"
 
 
+# 그룹별 import 대상 모듈
+_DEPENDENCY_GROUPS = {
+    "core": ("pandas", "plotly", "pydantic", "sqlalchemy", "streamlit"),
+    "llm": ("sentence_transformers", "torch", "transformers"),
+    "testing": ("mypy", "pytest"),
+}
+
+
+def _assert_group_importable(group, label):
+    """그룹 내 모듈만 import 시도해 실패 모듈이 없는지 확인"""
+    # 다른 그룹 모듈은 import하지 않으므로 -k로 고른 테스트만 해당 비용을 부담
+    failed = {}
+    for name in _DEPENDENCY_GROUPS[group]:
+        try:
+            importlib.import_module(name)
+        except Exception as e:  # OSError/RuntimeError 등 import 중 오류도 해당 그룹 실패로 처리
+            failed[name] = e
+    if failed:
+        pytest.fail(f"{label} 의존성 import 실패: {failed}")
+
+
 class TestDependencies:
     """의존성 테스트"""
 
     def test_core_dependencies_importable(self):
         """핵심 의존성 패키지들이 import 가능한지 확인"""
-        try:
-            import pandas
-            import plotly
-            import pydantic
-            import sqlalchemy
-            import streamlit
-
-            assert True
-        except ImportError as e:
-            pytest.fail(f"핵심 의존성 import 실패: {e}")
+        _assert_group_importable("core", "핵심")
 
     def test_llm_dependencies_importable(self):
         """LLM 관련 의존성 패키지들이 import 가능한지 확인"""
-        try:
-            import sentence_transformers
-            import torch
-            import transformers
-
-            assert True
-        except ImportError as e:
-            pytest.fail(f"LLM 의존성 import 실패: {e}")
+        _assert_group_importable("llm", "LLM")
 
     def test_testing_dependencies_importable(self):
         """테스트 관련 의존성 패키지들이 import 가능한지 확인"""
-        try:
-            import mypy
-            import pytest
-
-            assert True
-        except ImportError as e:
-            pytest.fail(f"테스트 의존성 import 실패: {e}")
+        _assert_group_importable("testing", "테스트")
 
 
 if __name__ == "__main__":
@@ -1,16 +1,20 @@
 """
 RAG 품질/속도 테스트
 project-structure.mdc 규칙에 따른 RAG 파이프라인 테스트
+모델을 로드하는 테스트는 RUN_RAG_TESTS=1 pytest -m rag 로 실행
 """
 
+import hashlib
+import json
 import os
 import shutil
 import sys
 import tempfile
 import time
-import unittest
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -24,247 +28,260 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class TestRAGPipeline(unittest.TestCase):
+# 테스트용 설정 (model_path는 검색기마다 임시 디렉토리로 지정)
+RAG_CONFIG = {
+    "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
+}
+
+# 테스트 문서
+TEST_DOCUMENTS = [
+    {
+        "id": "test_doc_1",
+        "text": "서울시 강남구는 대한민국의 주요 상업지구로, 높은 부동산 가격과 활발한 상업 활동으로 유명합니다.",
+        "metadata": {
+            "source": "test_source.pdf",
+            "page": 1,
+            "chunk": 1,
+            "type": "pdf",
+        },
+    },
+    {
+        "id": "test_doc_2",
+        "text": "강남구의 주요 업종은 IT, 금융, 의료, 교육 서비스 등이며, 특히 테헤란로 일대는 IT 기업들이 집중되어 있습니다.",
+        "metadata": {
+            "source": "test_source.pdf",
+            "page": 1,
+            "chunk": 2,
+            "type": "pdf",
+        },
+    },
+    {
+        "id": "test_doc_3",
+        "text": "서울시 정부는 강남구의 상권 활성화를 위해 다양한 정책을 시행하고 있으며, 스타트업 지원 프로그램도 운영하고 있습니다.",
+        "metadata": {
+            "source": "test_source.pdf",
+            "page": 2,
+            "chunk": 1,
+            "type": "pdf",
+        },
+    },
+]
+
+# 테스트 쿼리 정의
+TEST_QUERIES = [
+    {
+        "query": "강남구의 주요 업종은 무엇인가요?",
+        "expected_keywords": ["IT", "금융", "의료", "교육"],
+        "min_score": 0.3,
+    },
+    {
+        "query": "서울시 정부의 강남구 정책은?",
+        "expected_keywords": ["정책", "스타트업", "지원"],
+        "min_score": 0.3,
+    },
+    {
+        "query": "강남구 부동산 가격은?",
+        "expected_keywords": ["부동산", "가격"],
+        "min_score": 0.2,
+    },
+]
+
+# 청킹 결과 비교 시 제거할 공백 문자 변환 테이블
+_STRIP_WS = str.maketrans("", "", " \n\t")
+
+
+def _make_retriever(model_path):
+    """지정한 디렉토리를 모델 경로로 쓰는 검색기 생성 (xdist 워커 간 공유 방지)"""
+    retriever = HybridRetriever({**RAG_CONFIG, "model_path": str(model_path)})
+    retriever.model_path = Path(model_path)
+    return retriever
+
+
+def _build_or_skip(retriever):
+    """모델 초기화와 테스트 문서 인덱싱 (실패 시 테스트 스킵)"""
+    try:
+        if not retriever.initialize_models():
+            pytest.skip("RAG 엔진 초기화 실패")
+        if not retriever.build_index(TEST_DOCUMENTS):
+            pytest.skip("인덱스 구축 실패")
+    except Exception as e:
+        logger.warning(f"RAG 인덱스 구축 스킵: {e}")
+        pytest.skip(f"RAG 인덱스 구축 실패: {e}")
+    return retriever
+
+
+# 인덱스 저장 형식이나 구축 코드가 바뀌면 올려서 이전 캐시를 무효화
+_INDEX_CACHE_VERSION = 1
+
+
+def _index_cache_dir():
+    """캐시 버전, 테스트 문서, 임베딩 모델의 내용 해시로 구분한 인덱스 캐시 디렉토리"""
+    payload = json.dumps(
+        [_INDEX_CACHE_VERSION, TEST_DOCUMENTS, RAG_CONFIG["embedding_model"]],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return Path(tempfile.gettempdir()) / "rag_test_cache" / key
+
+
+@pytest.fixture(scope="session")
+def rag_indexed():
+    """디스크 캐시에서 인덱스를 로드하고, 없을 때만 구축해 저장하는 읽기 전용 검색기"""
+    # 버전·문서·모델이 바뀌면 해시가 달라져 새 디렉토리에 다시 구축
+    # (이 픽스처를 쓰는 TestRAGPipeline은 xdist_group으로 한 워커에서만 실행)
+    cache_dir = _index_cache_dir()
+    if cache_dir.is_dir():
+        retriever = _make_retriever(cache_dir)
+        try:
+            if retriever.initialize_models() and retriever._load_index():
+                return retriever
+        except Exception as e:
+            logger.warning(f"캐시된 RAG 인덱스 로드 실패, 재구축: {e}")
+
+    # 임시 디렉토리에 구축·저장한 뒤 이름을 바꿔 완성된 캐시만 노출 (동시 실행 대비)
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    build_dir = Path(tempfile.mkdtemp(prefix=".build-", dir=cache_dir.parent))
+    try:
+        retriever = _build_or_skip(_make_retriever(build_dir))
+        retriever._save_index()
+        os.rename(build_dir, cache_dir)
+    except Exception as e:
+        # 다른 실행이 먼저 캐시를 완성했거나 저장에 실패 -> 메모리의 인덱스를 그대로 사용
+        logger.warning(f"RAG 인덱스 캐시 저장 생략: {e}")
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    retriever.model_path = cache_dir
+    return retriever
+
+
+@pytest.fixture
+def rag_engine(tmp_path):
+    """인덱스 없이 생성한 테스트별 검색기"""
+    return _make_retriever(tmp_path)
+
+
+@pytest.fixture
+def rag_writable(tmp_path):
+    """테스트 전용 디렉토리에 새로 인덱싱한 검색기 (저장/로드 검증용)"""
+    return _build_or_skip(_make_retriever(tmp_path))
+
+
+@pytest.mark.rag
+@pytest.mark.slow
+@pytest.mark.xdist_group("rag_index")
+@pytest.mark.skipif(
+    not os.environ.get("RUN_RAG_TESTS"),
+    reason="임베딩 모델 로드가 필요한 RAG 테스트 (RUN_RAG_TESTS=1 설정 시 실행)",
+)
+class TestRAGPipeline:
     """RAG 파이프라인 테스트 클래스"""
 
-    @classmethod
-    def setUpClass(cls):
-        """테스트 클래스 초기화"""
-        # 테스트용 설정
-        cls.config = {
-            "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
-            "model_path": "tests/test_models",
-        }
-
-        # HybridRetriever 인스턴스 생성
-        cls.rag_engine = HybridRetriever(cls.config)
-
-        # 테스트 문서 생성
-        cls.test_documents = [
-            {
-                "id": "test_doc_1",
-                "text": "서울시 강남구는 대한민국의 주요 상업지구로, 높은 부동산 가격과 활발한 상업 활동으로 유명합니다.",
-                "metadata": {
-                    "source": "test_source.pdf",
-                    "page": 1,
-                    "chunk": 1,
-                    "type": "pdf",
-                },
-            },
-            {
-                "id": "test_doc_2",
-                "text": "강남구의 주요 업종은 IT, 금융, 의료, 교육 서비스 등이며, 특히 테헤란로 일대는 IT 기업들이 집중되어 있습니다.",
-                "metadata": {
-                    "source": "test_source.pdf",
-                    "page": 1,
-                    "chunk": 2,
-                    "type": "pdf",
-                },
-            },
-            {
-                "id": "test_doc_3",
-                "text": "서울시 정부는 강남구의 상권 활성화를 위해 다양한 정책을 시행하고 있으며, 스타트업 지원 프로그램도 운영하고 있습니다.",
-                "metadata": {
-                    "source": "test_source.pdf",
-                    "page": 2,
-                    "chunk": 1,
-                    "type": "pdf",
-                },
-            },
-        ]
-
-        # 테스트 쿼리 정의
-        cls.test_queries = [
-            {
-                "query": "강남구의 주요 업종은 무엇인가요?",
-                "expected_keywords": ["IT", "금융", "의료", "교육"],
-                "min_score": 0.3,
-            },
-            {
-                "query": "서울시 정부의 강남구 정책은?",
-                "expected_keywords": ["정책", "스타트업", "지원"],
-                "min_score": 0.3,
-            },
-            {
-                "query": "강남구 부동산 가격은?",
-                "expected_keywords": ["부동산", "가격"],
-                "min_score": 0.2,
-            },
-        ]
-
-    def setUp(self):
-        """각 테스트 전 실행"""
-        # 테스트용 임시 디렉토리 생성
-        self.temp_dir = tempfile.mkdtemp()
-        self.rag_engine.model_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """각 테스트 후 실행"""
-        # 임시 디렉토리 정리
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def test_rag_engine_initialization(self):
+    def test_rag_engine_initialization(self, rag_engine):
         """RAG 엔진 초기화 테스트"""
+        # 모델 로드 중 예외(모델 미설치 등)만 스킵하고 검증 실패는 그대로 드러냄
         try:
-            success = self.rag_engine.initialize_models()
-            self.assertTrue(success, "RAG 엔진 초기화가 실패했습니다")
-            logger.info("RAG 엔진 초기화 테스트 통과")
+            success = rag_engine.initialize_models()
         except Exception as e:
             logger.warning(f"RAG 엔진 초기화 테스트 스킵: {e}")
-            self.skipTest(f"RAG 엔진 초기화 실패: {e}")
-
-    def test_document_indexing(self):
-        """문서 인덱싱 테스트"""
-        try:
-            success = self.rag_engine.build_index(self.test_documents)
-            self.assertTrue(success, "문서 인덱싱이 실패했습니다")
+            pytest.skip(f"RAG 엔진 초기화 실패: {e}")
 
-            # 인덱스 통계 확인
-            stats = self.rag_engine.get_index_stats()
-            self.assertEqual(
-                stats["total_documents"],
-                len(self.test_documents),
-                "인덱싱된 문서 수가 일치하지 않습니다",
-            )
-            self.assertTrue(stats["index_built"], "BM25 인덱스가 구축되지 않았습니다")
-
-            logger.info("문서 인덱싱 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"문서 인덱싱 테스트 스킵: {e}")
-            self.skipTest(f"문서 인덱싱 실패: {e}")
+        assert success, "RAG 엔진 초기화가 실패했습니다"
+        logger.info("RAG 엔진 초기화 테스트 통과")
 
-    def test_hybrid_search_quality(self):
+    def test_document_indexing(self, rag_indexed):
+        """문서 인덱싱 테스트"""
+        # 인덱스 통계 확인
+        stats = rag_indexed.get_index_stats()
+        assert stats["total_documents"] == len(
+            TEST_DOCUMENTS
+        ), "인덱싱된 문서 수가 일치하지 않습니다"
+        assert stats["index_built"], "BM25 인덱스가 구축되지 않았습니다"
+
+        logger.info("문서 인덱싱 테스트 통과")
+
+    @pytest.mark.parametrize(
+        "test_case", TEST_QUERIES, ids=lambda case: case["query"][:20]
+    )
+    def test_hybrid_search_quality(self, rag_indexed, test_case):
         """하이브리드 검색 품질 테스트"""
-        try:
-            # 인덱스 구축
-            if not self.rag_engine.build_index(self.test_documents):
-                self.skipTest("인덱스 구축 실패")
-
-            for i, test_case in enumerate(self.test_queries):
-                with self.subTest(query=test_case["query"]):
-                    results = self.rag_engine.search(
-                        test_case["query"], search_type="hybrid", top_k=3
-                    )
-
-                    # 결과 존재 확인
-                    self.assertGreater(
-                        len(results), 0, f"쿼리 {i+1}에 대한 검색 결과가 없습니다"
-                    )
-
-                    # 점수 확인
-                    for result in results:
-                        self.assertIn(
-                            "combined_score", result, "결과에 combined_score가 없습니다"
-                        )
-                        self.assertGreaterEqual(
-                            result["combined_score"],
-                            test_case["min_score"],
-                            "검색 점수가 최소 기준보다 낮습니다",
-                        )
-
-                    # 키워드 포함 확인
-                    found_keywords = []
-                    for result in results:
-                        text = result["text"].lower()
-                        for keyword in test_case["expected_keywords"]:
-                            if keyword.lower() in text:
-                                found_keywords.append(keyword)
-
-                    self.assertGreater(
-                        len(found_keywords),
-                        0,
-                        f"쿼리 {i+1}에서 예상 키워드를 찾을 수 없습니다",
-                    )
-
-                    logger.info(f"검색 품질 테스트 {i+1} 통과: {test_case['query']}")
-
-        except Exception as e:
-            logger.warning(f"하이브리드 검색 품질 테스트 스킵: {e}")
+        results = rag_indexed.search(
+            test_case["query"], search_type="hybrid", top_k=3
+        )
 
-    def test_vector_search_quality(self):
-        """벡터 검색 품질 테스트"""
-        try:
-            # 인덱스 구축
-            if not self.rag_engine.build_index(self.test_documents):
-                self.skipTest("인덱스 구축 실패")
+        # 결과 존재 확인
+        assert len(results) > 0, "검색 결과가 없습니다"
+
+        # 점수 확인
+        for result in results:
+            assert "combined_score" in result, "결과에 combined_score가 없습니다"
+            assert (
+                result["combined_score"] >= test_case["min_score"]
+            ), "검색 점수가 최소 기준보다 낮습니다"
+
+        # 키워드 포함 확인
+        found_keywords = [
+            keyword
+            for result in results
+            for keyword in test_case["expected_keywords"]
+            if keyword.lower() in result["text"].lower()
+        ]
+        assert found_keywords, "예상 키워드를 찾을 수 없습니다"
 
-            query = "강남구의 주요 업종은 무엇인가요?"
-            results = self.rag_engine.search(query, search_type="vector", top_k=2)
+        logger.info(f"검색 품질 테스트 통과: {test_case['query']}")
 
-            # 결과 확인
-            self.assertGreater(len(results), 0, "벡터 검색 결과가 없습니다")
+    def test_vector_search_quality(self, rag_indexed):
+        """벡터 검색 품질 테스트"""
+        query = "강남구의 주요 업종은 무엇인가요?"
+        results = rag_indexed.search(query, search_type="vector", top_k=2)
 
-            # 점수 확인
-            for result in results:
-                self.assertIn("vector_score", result, "결과에 vector_score가 없습니다")
-                self.assertGreater(
-                    result["vector_score"], 0, "벡터 점수가 0보다 작습니다"
-                )
+        # 결과 확인
+        assert len(results) > 0, "벡터 검색 결과가 없습니다"
 
-            logger.info("벡터 검색 품질 테스트 통과")
+        # 점수 확인
+        for result in results:
+            assert "vector_score" in result, "결과에 vector_score가 없습니다"
+            assert result["vector_score"] > 0, "벡터 점수가 0보다 작습니다"
 
-        except Exception as e:
-            logger.warning(f"벡터 검색 품질 테스트 스킵: {e}")
+        logger.info("벡터 검색 품질 테스트 통과")
 
-    def test_bm25_search_quality(self):
+    def test_bm25_search_quality(self, rag_indexed):
         """BM25 검색 품질 테스트"""
-        try:
-            # 인덱스 구축
-            if not self.rag_engine.build_index(self.test_documents):
-                self.skipTest("인덱스 구축 실패")
+        query = "강남구의 주요 업종은 무엇인가요?"
+        results = rag_indexed.search(query, search_type="bm25", top_k=2)
 
-            query = "강남구의 주요 업종은 무엇인가요?"
-            results = self.rag_engine.search(query, search_type="bm25", top_k=2)
+        # 결과 확인
+        assert len(results) > 0, "BM25 검색 결과가 없습니다"
 
-            # 결과 확인
-            self.assertGreater(len(results), 0, "BM25 검색 결과가 없습니다")
+        # 점수 확인
+        for result in results:
+            assert "bm25_score" in result, "결과에 bm25_score가 없습니다"
+            assert result["bm25_score"] > 0, "BM25 점수가 0보다 작습니다"
 
-            # 점수 확인
-            for result in results:
-                self.assertIn("bm25_score", result, "결과에 bm25_score가 없습니다")
-                self.assertGreater(
-                    result["bm25_score"], 0, "BM25 점수가 0보다 작습니다"
-                )
-
-            logger.info("BM25 검색 품질 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"BM25 검색 품질 테스트 스킵: {e}")
+        logger.info("BM25 검색 품질 테스트 통과")
 
-    def test_search_performance(self):
+    def test_search_performance(self, rag_indexed):
         """검색 성능 테스트"""
-        try:
-            # 인덱스 구축
-            if not self.rag_engine.build_index(self.test_documents):
-                self.skipTest("인덱스 구축 실패")
-
-            query = "강남구의 주요 업종은 무엇인가요?"
+        query = "강남구의 주요 업종은 무엇인가요?"
 
-            # 성능 측정
-            start_time = time.time()
-            results = self.rag_engine.search(query, search_type="hybrid", top_k=5)
-            end_time = time.time()
+        # 성능 측정
+        start_time = time.time()
+        results = rag_indexed.search(query, search_type="hybrid", top_k=5)
+        end_time = time.time()
 
-            response_time = end_time - start_time
+        response_time = end_time - start_time
 
-            # 응답 시간 확인 (3초 이내)
-            self.assertLess(
-                response_time,
-                3.0,
-                f"검색 응답 시간이 너무 깁니다: {response_time:.2f}초",
-            )
+        # 응답 시간 확인 (3초 이내)
+        assert (
+            response_time < 3.0
+        ), f"검색 응답 시간이 너무 깁니다: {response_time:.2f}초"
 
-            # 결과 확인
-            self.assertGreater(len(results), 0, "검색 결과가 없습니다")
+        # 결과 확인
+        assert len(results) > 0, "검색 결과가 없습니다"
 
-            logger.info(f"검색 성능 테스트 통과 - 응답 시간: {response_time:.2f}초")
-
-        except Exception as e:
-            logger.warning(f"검색 성능 테스트 스킵: {e}")
+        logger.info(f"검색 성능 테스트 통과 - 응답 시간: {response_time:.2f}초")
 
-    def test_text_chunking(self):
+    def test_text_chunking(self, rag_engine):
         """텍스트 청킹 테스트"""
         long_text = """
         서울시 강남구는 대한민국의 주요 상업지구입니다. 
@@ -275,77 +292,68 @@ class TestRAGPipeline(unittest.TestCase):
         스타트업 지원 프로그램도 운영하고 있습니다.
         """
 
-        chunks = self.rag_engine._chunk_text(long_text, chunk_size=100, overlap=20)
+        chunks = rag_engine._chunk_text(long_text, chunk_size=100, overlap=20)
 
         # 청킹 결과 확인
-        self.assertGreater(len(chunks), 1, "텍스트가 청킹되지 않았습니다")
+        assert len(chunks) > 1, "텍스트가 청킹되지 않았습니다"
 
         # 청크 크기 확인
         for chunk in chunks:
-            self.assertLessEqual(
-                len(chunk), 120, "청크 크기가 너무 큽니다"
-            )  # overlap 고려
+            assert len(chunk) <= 120, "청크 크기가 너무 큽니다"  # overlap 고려
 
         # 원본 텍스트 보존 확인
-        original_text = long_text.replace("\n", "").replace(" ", "")
-        chunked_text = "".join(chunks).replace("\n", "").replace(" ", "")
-        self.assertIn(
-            chunked_text[:50], original_text, "청킹된 텍스트가 원본과 다릅니다"
-        )
+        original_text = long_text.translate(_STRIP_WS)
+        assert (
+            chunks[0].translate(_STRIP_WS)[:50] in original_text
+        ), "청킹된 텍스트가 원본과 다릅니다"
+        # 청크를 합치지 않고 길이 합으로 원본 전체가 포함되는지 확인 (overlap 중복 허용)
+        assert sum(len(chunk.translate(_STRIP_WS)) for chunk in chunks) >= len(
+            original_text
+        ), "청킹 과정에서 텍스트가 누락되었습니다"
 
         logger.info("텍스트 청킹 테스트 통과")
 
-    def test_korean_tokenization(self):
+    def test_korean_tokenization(self, rag_engine):
         """한국어 토큰화 테스트"""
         korean_text = "서울시 강남구는 대한민국의 주요 상업지구입니다."
-        tokens = self.rag_engine._tokenize_korean(korean_text)
+        tokens = rag_engine._tokenize_korean(korean_text)
 
         # 토큰화 결과 확인
-        self.assertGreater(len(tokens), 0, "토큰화 결과가 없습니다")
+        assert len(tokens) > 0, "토큰화 결과가 없습니다"
 
-        # 예상 토큰 확인
-        expected_tokens = ["서울시", "강남구는", "대한민국의", "주요", "상업지구입니다"]
-        for token in expected_tokens:
-            self.assertIn(token, tokens, f"토큰 '{token}'이 없습니다")
+        # 예상 토큰 확인 (토큰 목록을 한 번만 집합으로 변환해 포함 여부 검사)
+        expected_tokens = {"서울시", "강남구는", "대한민국의", "주요", "상업지구입니다"}
+        missing = expected_tokens - set(tokens)
+        assert not missing, f"토큰 {sorted(missing)}이 없습니다"
 
         logger.info("한국어 토큰화 테스트 통과")
 
-    def test_index_persistence(self):
+    def test_index_persistence(self, rag_writable):
         """인덱스 지속성 테스트"""
-        try:
-            # 인덱스 구축
-            if not self.rag_engine.build_index(self.test_documents):
-                self.skipTest("인덱스 구축 실패")
-
-            # 인덱스 저장
-            self.rag_engine._save_index()
+        # 인덱스 저장
+        rag_writable._save_index()
 
-            # 새로운 인스턴스 생성하여 인덱스 로드
-            new_rag_engine = HybridRetriever(self.config)
-            new_rag_engine.model_path = Path(self.temp_dir)
+        # 새로운 인스턴스 생성하여 인덱스 로드
+        new_rag_engine = _make_retriever(rag_writable.model_path)
 
-            success = new_rag_engine._load_index()
-            self.assertTrue(success, "인덱스 로드가 실패했습니다")
+        success = new_rag_engine._load_index()
+        assert success, "인덱스 로드가 실패했습니다"
 
-            # 로드된 인덱스로 검색 테스트
-            query = "강남구의 주요 업종은 무엇인가요?"
-            results = new_rag_engine.search(query, search_type="hybrid", top_k=2)
+        # 로드된 인덱스로 검색 테스트
+        query = "강남구의 주요 업종은 무엇인가요?"
+        results = new_rag_engine.search(query, search_type="hybrid", top_k=2)
 
-            self.assertGreater(len(results), 0, "로드된 인덱스로 검색 결과가 없습니다")
+        assert len(results) > 0, "로드된 인덱스로 검색 결과가 없습니다"
 
-            logger.info("인덱스 지속성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"인덱스 지속성 테스트 스킵: {e}")
+        logger.info("인덱스 지속성 테스트 통과")
 
 
-class TestRAGQuality(unittest.TestCase):
+class TestRAGQuality:
     """RAG 품질 테스트 클래스"""
 
-    def test_relevance_scoring(self):
-        """관련성 점수 테스트"""
-        # 관련성 점수 계산 로직 테스트
-        test_cases = [
+    @pytest.mark.parametrize(
+        "test_case",
+        [
             {
                 "query": "강남구 업종",
                 "text": "강남구의 주요 업종은 IT, 금융, 의료입니다.",
@@ -356,12 +364,13 @@ class TestRAGQuality(unittest.TestCase):
                 "text": "서울시 전체의 인구 통계입니다.",
                 "expected_relevance": "low",
             },
-        ]
-
-        for test_case in test_cases:
-            with self.subTest(query=test_case["query"]):
-                # 실제 구현에서는 관련성 점수 계산 로직을 테스트
-                self.assertTrue(True, "관련성 점수 테스트는 실제 구현에서 수행됩니다")
+        ],
+        ids=lambda case: case["expected_relevance"],
+    )
+    def test_relevance_scoring(self, test_case):
+        """관련성 점수 테스트"""
+        # 실제 구현에서는 관련성 점수 계산 로직을 테스트
+        assert test_case["query"], "관련성 점수 테스트는 실제 구현에서 수행됩니다"
 
     def test_diversity_metrics(self):
         """다양성 메트릭 테스트"""
@@ -373,24 +382,20 @@ class TestRAGQuality(unittest.TestCase):
         ]
 
         # 다양성 측정 (소스별)
-        sources = [result["metadata"]["source"] for result in results]
-        unique_sources = set(sources)
+        unique_sources = {result["metadata"]["source"] for result in results}
 
-        self.assertEqual(
-            len(unique_sources), len(results), "검색 결과의 다양성이 부족합니다"
-        )
+        assert len(unique_sources) == len(results), "검색 결과의 다양성이 부족합니다"
 
-    def test_coverage_metrics(self):
+    @pytest.mark.parametrize("aspect", ["업종", "정책"])
+    def test_coverage_metrics(self, aspect):
         """커버리지 메트릭 테스트"""
         # 검색 결과가 쿼리의 다양한 측면을 커버하는지 테스트
         query = "강남구의 주요 업종과 정책"
-        expected_aspects = ["업종", "정책"]
 
         # 실제 구현에서는 각 측면에 대한 커버리지를 측정
-        for aspect in expected_aspects:
-            self.assertIn(aspect, query, f"쿼리에 '{aspect}' 측면이 포함되어야 합니다")
+        assert aspect in query, f"쿼리에 '{aspect}' 측면이 포함되어야 합니다"
 
 
 if __name__ == "__main__":
     # 테스트 실행
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -5,398 +5,308 @@ project-structure.mdc 규칙에 따른 보고서 생성 테스트
 
 import json
 import os
-import shutil
 import sys
-import tempfile
-import unittest
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import logging
 
-from pipelines.report_generator import ReportGenerator
-
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class TestReportGeneration(unittest.TestCase):
+# 테스트용 데이터
+QUANTITATIVE_DATA = {
+    "sql_results": [
+        {
+            "region_name": "강남구",
+            "total_sales": 1000000000,
+            "industry_count": 15,
+        },
+        {
+            "region_name": "서초구",
+            "total_sales": 800000000,
+            "industry_count": 12,
+        },
+        {
+            "region_name": "송파구",
+            "total_sales": 600000000,
+            "industry_count": 10,
+        },
+    ],
+    "charts": [
+        {"type": "bar", "title": "지역별 매출", "data": "test_data"},
+        {"type": "pie", "title": "업종별 분포", "data": "test_data"},
+    ],
+}
+
+QUALITATIVE_DATA = {
+    "rag_results": [
+        {
+            "text": "강남구는 IT, 금융, 의료 업종이 발달한 상업지구입니다.",
+            "metadata": {"source": "seoul_commercial_report.pdf", "page": 1},
+            "score": 0.95,
+        },
+        {
+            "text": "서울시 정부는 강남구 상권 활성화를 위한 정책을 시행하고 있습니다.",
+            "metadata": {"source": "seoul_policy_document.pdf", "page": 3},
+            "score": 0.87,
+        },
+    ]
+}
+
+# 테스트용 보고서 설정
+REPORT_CONFIG = {
+    "report_type": "comprehensive",
+    "target_area": "강남구",
+    "target_industry": "IT",
+    "analysis_period": "2024년",
+}
+
+
+@pytest.fixture
+def report_output(report_generator, tmp_path, monkeypatch):
+    """테스트별 임시 디렉토리에서 내보내도록 작업 경로를 바꾼 공유 보고서 생성기"""
+    # export_report는 현재 작업 경로의 reports/ 아래에 파일을 씀
+    (tmp_path / "reports").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return report_generator
+
+
+# 세션 보고서 생성기를 공유하므로 한 워커에 배치 (pytest.ini의 --dist=loadgroup)
+@pytest.mark.xdist_group("report_gen")
+class TestReportGeneration:
     """보고서 생성 테스트 클래스"""
 
-    @classmethod
-    def setUpClass(cls):
-        """테스트 클래스 초기화"""
-        # 테스트용 설정
-        cls.config = {
-            "llm_model": "microsoft/DialoGPT-medium",
-            "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
-            "output_path": "tests/test_reports",
-        }
+    def test_report_generator_initialization(self, report_generator):
+        """보고서 생성기 초기화 테스트"""
+        # 세션 픽스처에서 주입한 LLM을 재사용 (테스트마다 다시 초기화하지 않음)
+        assert report_generator.llm is not None, "보고서 생성기 초기화가 실패했습니다"
+        logger.info("보고서 생성기 초기화 테스트 통과")
+
+    @pytest.mark.parametrize(
+        "method_name, args, min_length, keywords, match",
+        [
+            (
+                "generate_executive_summary",
+                (QUANTITATIVE_DATA, QUALITATIVE_DATA["rag_results"]),
+                50,
+                ("강남구", "매출", "업종", "분석"),
+                all,
+            ),
+            (
+                "generate_quantitative_analysis",
+                (QUANTITATIVE_DATA["sql_results"],),
+                100,
+                ("강남구", "매출"),
+                all,
+            ),
+            (
+                "generate_qualitative_analysis",
+                (QUALITATIVE_DATA["rag_results"],),
+                100,
+                ("강남구", "업종"),
+                all,
+            ),
+            (
+                "generate_insights_and_recommendations",
+                (QUANTITATIVE_DATA, QUALITATIVE_DATA["rag_results"]),
+                100,
+                ("인사이트", "권고", "전략", "기회", "위험"),
+                any,
+            ),
+        ],
+        ids=["executive_summary", "quantitative", "qualitative", "insights"],
+    )
+    def test_section_generation(
+        self,
+        report_generator,
+        fake_report_llm,
+        method_name,
+        args,
+        min_length,
+        keywords,
+        match,
+    ):
+        """보고서 섹션별 텍스트 생성 테스트"""
+        calls_before = fake_report_llm.calls
+        text = getattr(report_generator, method_name)(*args)
+
+        # 대체 문구가 아닌 주입한 가짜 LLM의 응답인지 확인
+        assert (
+            fake_report_llm.calls == calls_before + 1
+        ), f"{method_name}이 LLM을 호출하지 않았습니다"
+
+        # 생성 결과 구조 확인
+        assert isinstance(text, str), f"{method_name} 결과가 문자열이 아닙니다"
+        assert len(text) > min_length, f"{method_name} 결과가 너무 짧습니다"
+
+        # 핵심 키워드 포함 확인 (요약/분석은 전부, 인사이트는 하나 이상)
+        assert match(
+            keyword in text for keyword in keywords
+        ), f"{method_name} 결과에 핵심 키워드 {keywords}가 없습니다"
+
+        logger.info(f"{method_name} 생성 테스트 통과")
+
+    def test_full_report_generation(self, report_generator):
+        """전체 보고서 생성 테스트"""
+        report = report_generator.generate_full_report(REPORT_CONFIG)
 
-        # ReportGenerator 인스턴스 생성
-        cls.report_generator = ReportGenerator(cls.config)
-
-        # 테스트용 데이터
-        cls.test_quantitative_data = {
-            "sql_results": [
-                {
-                    "region_name": "강남구",
-                    "total_sales": 1000000000,
-                    "industry_count": 15,
-                },
-                {
-                    "region_name": "서초구",
-                    "total_sales": 800000000,
-                    "industry_count": 12,
-                },
-                {
-                    "region_name": "송파구",
-                    "total_sales": 600000000,
-                    "industry_count": 10,
-                },
-            ],
-            "charts": [
-                {"type": "bar", "title": "지역별 매출", "data": "test_data"},
-                {"type": "pie", "title": "업종별 분포", "data": "test_data"},
-            ],
-        }
+        # 보고서 구조 확인
+        assert isinstance(report, dict), "보고서가 딕셔너리가 아닙니다"
 
-        cls.test_qualitative_data = {
-            "rag_results": [
-                {
-                    "text": "강남구는 IT, 금융, 의료 업종이 발달한 상업지구입니다.",
-                    "metadata": {"source": "seoul_commercial_report.pdf", "page": 1},
-                    "score": 0.95,
-                },
-                {
-                    "text": "서울시 정부는 강남구 상권 활성화를 위한 정책을 시행하고 있습니다.",
-                    "metadata": {"source": "seoul_policy_document.pdf", "page": 3},
-                    "score": 0.87,
-                },
-            ]
-        }
+        # 필수 섹션 확인
+        required_sections = [
+            "executive_summary",
+            "quantitative_analysis",
+            "qualitative_analysis",
+            "insights_recommendations",
+            "data_sources",
+            "metadata",
+        ]
 
-        # 테스트용 보고서 설정
-        cls.test_report_config = {
-            "report_type": "comprehensive",
-            "target_area": "강남구",
-            "target_industry": "IT",
-            "analysis_period": "2024년",
-        }
+        for section in required_sections:
+            assert section in report, f"보고서에 '{section}' 섹션이 없습니다"
+            assert report[section] is not None, f"'{section}' 섹션이 비어있습니다"
 
-    def setUp(self):
-        """각 테스트 전 실행"""
-        # 테스트용 임시 디렉토리 생성
-        self.temp_dir = tempfile.mkdtemp()
-        self.report_generator.config["output_path"] = self.temp_dir
+        # 메타데이터 확인
+        metadata = report["metadata"]
+        assert "generated_at" in metadata, "메타데이터에 생성 시간이 없습니다"
+        assert "report_type" in metadata, "메타데이터에 보고서 유형이 없습니다"
 
-    def tearDown(self):
-        """각 테스트 후 실행"""
-        # 임시 디렉토리 정리
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        logger.info("전체 보고서 생성 테스트 통과")
 
-    def test_report_generator_initialization(self):
-        """보고서 생성기 초기화 테스트"""
-        try:
-            success = self.report_generator.initialize()
-            self.assertTrue(success, "보고서 생성기 초기화가 실패했습니다")
-            logger.info("보고서 생성기 초기화 테스트 통과")
-        except Exception as e:
-            logger.warning(f"보고서 생성기 초기화 테스트 스킵: {e}")
-            self.skipTest(f"보고서 생성기 초기화 실패: {e}")
-
-    def test_executive_summary_generation(self):
-        """경영진 요약 생성 테스트"""
-        try:
-            summary = self.report_generator.generate_executive_summary(
-                self.test_quantitative_data,
-                self.test_qualitative_data,
-                self.test_report_config,
-            )
-
-            # 요약 구조 확인
-            self.assertIsInstance(summary, str, "경영진 요약이 문자열이 아닙니다")
-            self.assertGreater(len(summary), 50, "경영진 요약이 너무 짧습니다")
-
-            # 핵심 키워드 포함 확인
-            expected_keywords = ["강남구", "매출", "업종", "분석"]
-            for keyword in expected_keywords:
-                self.assertIn(keyword, summary, f"요약에 '{keyword}' 키워드가 없습니다")
-
-            logger.info("경영진 요약 생성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"경영진 요약 생성 테스트 스킵: {e}")
-
-    def test_quantitative_analysis_generation(self):
-        """정량 분석 생성 테스트"""
-        try:
-            analysis = self.report_generator.generate_quantitative_analysis(
-                self.test_quantitative_data, self.test_report_config
-            )
-
-            # 분석 구조 확인
-            self.assertIsInstance(analysis, str, "정량 분석이 문자열이 아닙니다")
-            self.assertGreater(len(analysis), 100, "정량 분석이 너무 짧습니다")
-
-            # 데이터 기반 내용 확인
-            self.assertIn("강남구", analysis, "분석에 대상 지역이 없습니다")
-            self.assertIn("매출", analysis, "분석에 매출 정보가 없습니다")
-
-            logger.info("정량 분석 생성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"정량 분석 생성 테스트 스킵: {e}")
-
-    def test_qualitative_analysis_generation(self):
-        """정성 분석 생성 테스트"""
-        try:
-            analysis = self.report_generator.generate_qualitative_analysis(
-                self.test_qualitative_data, self.test_report_config
-            )
-
-            # 분석 구조 확인
-            self.assertIsInstance(analysis, str, "정성 분석이 문자열이 아닙니다")
-            self.assertGreater(len(analysis), 100, "정성 분석이 너무 짧습니다")
-
-            # 근거 기반 내용 확인
-            self.assertIn("강남구", analysis, "분석에 대상 지역이 없습니다")
-            self.assertIn("업종", analysis, "분석에 업종 정보가 없습니다")
-
-            logger.info("정성 분석 생성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"정성 분석 생성 테스트 스킵: {e}")
-
-    def test_insights_generation(self):
-        """인사이트 생성 테스트"""
-        try:
-            insights = self.report_generator.generate_insights(
-                self.test_quantitative_data,
-                self.test_qualitative_data,
-                self.test_report_config,
-            )
-
-            # 인사이트 구조 확인
-            self.assertIsInstance(insights, str, "인사이트가 문자열이 아닙니다")
-            self.assertGreater(len(insights), 100, "인사이트가 너무 짧습니다")
-
-            # 인사이트 키워드 확인
-            insight_keywords = ["인사이트", "권고", "전략", "기회", "위험"]
-            found_keywords = [kw for kw in insight_keywords if kw in insights]
-            self.assertGreater(
-                len(found_keywords), 0, "인사이트에 핵심 키워드가 없습니다"
-            )
-
-            logger.info("인사이트 생성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"인사이트 생성 테스트 스킵: {e}")
-
-    def test_full_report_generation(self):
-        """전체 보고서 생성 테스트"""
-        try:
-            report = self.report_generator.generate_full_report(self.test_report_config)
-
-            # 보고서 구조 확인
-            self.assertIsInstance(report, dict, "보고서가 딕셔너리가 아닙니다")
-
-            # 필수 섹션 확인
-            required_sections = [
-                "executive_summary",
-                "quantitative_analysis",
-                "qualitative_analysis",
-                "insights_recommendations",
-                "data_sources",
-                "metadata",
-            ]
-
-            for section in required_sections:
-                self.assertIn(section, report, f"보고서에 '{section}' 섹션이 없습니다")
-                self.assertIsNotNone(
-                    report[section], f"'{section}' 섹션이 비어있습니다"
-                )
-
-            # 메타데이터 확인
-            metadata = report["metadata"]
-            self.assertIn("generated_at", metadata, "메타데이터에 생성 시간이 없습니다")
-            self.assertIn(
-                "report_type", metadata, "메타데이터에 보고서 유형이 없습니다"
-            )
-
-            logger.info("전체 보고서 생성 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"전체 보고서 생성 테스트 스킵: {e}")
-
-    def test_report_export_json(self):
+    def test_report_export_json(self, report_output):
         """JSON 보고서 내보내기 테스트"""
-        try:
-            # 테스트 보고서 생성
-            report = {
-                "executive_summary": "테스트 요약",
-                "quantitative_analysis": "테스트 정량 분석",
-                "qualitative_analysis": "테스트 정성 분석",
-                "insights_recommendations": "테스트 인사이트",
-                "metadata": {"generated_at": "2024-01-01", "report_type": "test"},
-            }
-
-            filename = self.report_generator.export_report(report, "json")
-
-            # 파일 생성 확인
-            self.assertIsNotNone(filename, "JSON 파일이 생성되지 않았습니다")
-            self.assertTrue(os.path.exists(filename), "JSON 파일이 존재하지 않습니다")
-
-            # 파일 내용 확인
-            with open(filename, encoding="utf-8") as f:
-                exported_data = json.load(f)
-
-            self.assertEqual(
-                exported_data["executive_summary"],
-                report["executive_summary"],
-                "내보낸 JSON 데이터가 원본과 다릅니다",
-            )
-
-            logger.info("JSON 보고서 내보내기 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"JSON 보고서 내보내기 테스트 스킵: {e}")
-
-    def test_report_export_markdown(self):
+        # 테스트 보고서 생성
+        report = {
+            "executive_summary": "테스트 요약",
+            "quantitative_analysis": "테스트 정량 분석",
+            "qualitative_analysis": "테스트 정성 분석",
+            "insights_recommendations": "테스트 인사이트",
+            "metadata": {"generated_at": "2024-01-01", "report_type": "test"},
+        }
+
+        filename = report_output.export_report(report, "json")
+
+        # 파일 생성 확인
+        assert filename is not None, "JSON 파일이 생성되지 않았습니다"
+        assert os.path.exists(filename), "JSON 파일이 존재하지 않습니다"
+
+        # 파일 내용 확인
+        with open(filename, encoding="utf-8") as f:
+            exported_data = json.load(f)
+
+        assert (
+            exported_data["executive_summary"] == report["executive_summary"]
+        ), "내보낸 JSON 데이터가 원본과 다릅니다"
+
+        logger.info("JSON 보고서 내보내기 테스트 통과")
+
+    def test_report_export_markdown(self, report_output):
         """Markdown 보고서 내보내기 테스트"""
-        try:
-            # 테스트 보고서 생성
-            report = {
-                "executive_summary": "테스트 요약",
-                "quantitative_analysis": "테스트 정량 분석",
-                "qualitative_analysis": "테스트 정성 분석",
-                "insights_recommendations": "테스트 인사이트",
-                "metadata": {"generated_at": "2024-01-01", "report_type": "test"},
-            }
-
-            filename = self.report_generator.export_report(report, "markdown")
-
-            # 파일 생성 확인
-            self.assertIsNotNone(filename, "Markdown 파일이 생성되지 않았습니다")
-            self.assertTrue(
-                os.path.exists(filename), "Markdown 파일이 존재하지 않습니다"
-            )
-
-            # 파일 내용 확인
-            with open(filename, encoding="utf-8") as f:
-                content = f.read()
-
-            self.assertIn(
-                "# 상권분석 보고서", content, "Markdown 파일에 제목이 없습니다"
-            )
-            self.assertIn("테스트 요약", content, "Markdown 파일에 요약이 없습니다")
-
-            logger.info("Markdown 보고서 내보내기 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"Markdown 보고서 내보내기 테스트 스킵: {e}")
-
-    def test_data_source_tracking(self):
+        # 테스트 보고서 생성
+        report = {
+            "executive_summary": "테스트 요약",
+            "quantitative_analysis": "테스트 정량 분석",
+            "qualitative_analysis": "테스트 정성 분석",
+            "insights_recommendations": "테스트 인사이트",
+            "metadata": {"generated_at": "2024-01-01", "report_type": "test"},
+        }
+
+        filename = report_output.export_report(report, "markdown")
+
+        # 파일 생성 확인
+        assert filename is not None, "Markdown 파일이 생성되지 않았습니다"
+        assert os.path.exists(filename), "Markdown 파일이 존재하지 않습니다"
+
+        # 파일 내용 확인
+        with open(filename, encoding="utf-8") as f:
+            content = f.read()
+
+        assert "# test" in content, "Markdown 파일에 보고서 유형 제목이 없습니다"
+        assert "테스트 요약" in content, "Markdown 파일에 요약이 없습니다"
+
+        logger.info("Markdown 보고서 내보내기 테스트 통과")
+
+    def test_data_source_tracking(self, report_generator):
         """데이터 소스 추적 테스트"""
-        try:
-            data_sources = self.report_generator.extract_data_sources(
-                self.test_quantitative_data, self.test_qualitative_data
-            )
-
-            # 데이터 소스 구조 확인
-            self.assertIsInstance(
-                data_sources, dict, "데이터 소스가 딕셔너리가 아닙니다"
-            )
-            self.assertIn("quantitative", data_sources, "정량 데이터 소스가 없습니다")
-            self.assertIn("qualitative", data_sources, "정성 데이터 소스가 없습니다")
-
-            # 정성 데이터 소스 확인
-            qualitative_sources = data_sources["qualitative"]
-            self.assertGreater(
-                len(qualitative_sources), 0, "정성 데이터 소스가 없습니다"
-            )
-
-            for source in qualitative_sources:
-                self.assertIn("source", source, "데이터 소스에 source 정보가 없습니다")
-                self.assertIn("page", source, "데이터 소스에 page 정보가 없습니다")
-                self.assertIn("score", source, "데이터 소스에 score 정보가 없습니다")
-
-            logger.info("데이터 소스 추적 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"데이터 소스 추적 테스트 스킵: {e}")
-
-    def test_report_quality_metrics(self):
-        """보고서 품질 메트릭 테스트"""
-        try:
-            report = {
-                "executive_summary": "강남구는 서울시의 주요 상업지구로...",
-                "quantitative_analysis": "매출 데이터 분석 결과...",
-                "qualitative_analysis": "정책 문서 분석 결과...",
-                "insights_recommendations": "핵심 인사이트와 권고사항...",
-                "data_sources": {
-                    "quantitative": [{"source": "sales_data.csv"}],
-                    "qualitative": [
-                        {"source": "policy_doc.pdf", "page": 1, "score": 0.9},
-                        {"source": "market_report.pdf", "page": 3, "score": 0.8},
-                    ],
-                },
-            }
-
-            # 품질 메트릭 계산
-            metrics = self.report_generator.calculate_quality_metrics(report)
-
-            # 메트릭 구조 확인
-            self.assertIsInstance(metrics, dict, "품질 메트릭이 딕셔너리가 아닙니다")
-            self.assertIn("evidence_citation_rate", metrics, "근거 인용률이 없습니다")
-            self.assertIn("content_length", metrics, "내용 길이가 없습니다")
-            self.assertIn("section_completeness", metrics, "섹션 완성도가 없습니다")
-
-            # 근거 인용률 확인
-            citation_rate = metrics["evidence_citation_rate"]
-            self.assertGreaterEqual(citation_rate, 0.0, "근거 인용률이 0보다 작습니다")
-            self.assertLessEqual(citation_rate, 1.0, "근거 인용률이 1보다 큽니다")
-
-            logger.info("보고서 품질 메트릭 테스트 통과")
-
-        except Exception as e:
-            logger.warning(f"보고서 품질 메트릭 테스트 스킵: {e}")
-
-
-class TestReportQuality(unittest.TestCase):
+        report = report_generator.generate_full_report(REPORT_CONFIG)
+        data_sources = report["data_sources"]
+
+        # 데이터 소스 구조 확인
+        assert isinstance(data_sources, dict), "데이터 소스가 딕셔너리가 아닙니다"
+        assert "quantitative" in data_sources, "정량 데이터 소스가 없습니다"
+        assert "qualitative" in data_sources, "정성 데이터 소스가 없습니다"
+
+        # 정성 데이터 소스 확인 (검색 결과의 출처/페이지/점수 유지)
+        qualitative_sources = data_sources["qualitative"]
+        assert len(qualitative_sources) > 0, "정성 데이터 소스가 없습니다"
+
+        for source in qualitative_sources:
+            assert "source" in source["metadata"], "데이터 소스에 source 정보가 없습니다"
+            assert "page" in source["metadata"], "데이터 소스에 page 정보가 없습니다"
+            assert "score" in source, "데이터 소스에 score 정보가 없습니다"
+
+        # 부록의 문서 출처가 정성 데이터 소스와 일치하는지 확인
+        assert report["appendix"]["document_sources"] == [
+            source["metadata"] for source in qualitative_sources
+        ], "부록 문서 출처가 정성 데이터 소스와 다릅니다"
+
+        logger.info("데이터 소스 추적 테스트 통과")
+
+    def test_fallback_summary_without_llm(self, report_generator, monkeypatch):
+        """LLM이 없을 때 대체 요약 생성 테스트"""
+        monkeypatch.setattr(report_generator, "llm", None)
+
+        summary = report_generator.generate_executive_summary(
+            QUANTITATIVE_DATA, QUALITATIVE_DATA["rag_results"]
+        )
+
+        # 대체 요약은 입력 데이터 건수를 근거로 제시
+        sql_count = len(QUANTITATIVE_DATA["sql_results"])
+        doc_count = len(QUALITATIVE_DATA["rag_results"])
+        assert f"{sql_count}개 쿼리" in summary, "대체 요약에 쿼리 건수가 없습니다"
+        assert f"{doc_count}개 관련 문서" in summary, "대체 요약에 문서 건수가 없습니다"
+
+        logger.info("대체 요약 생성 테스트 통과")
+
+
+class TestReportQuality:
     """보고서 품질 테스트 클래스"""
 
-    def test_content_coherence(self):
-        """내용 일관성 테스트"""
-        # 보고서 섹션 간의 일관성 확인
-        sections = [
+    @pytest.mark.parametrize(
+        "section",
+        [
             "executive_summary",
             "quantitative_analysis",
             "qualitative_analysis",
             "insights_recommendations",
-        ]
-
+        ],
+    )
+    def test_content_coherence(self, section):
+        """내용 일관성 테스트"""
         # 실제 구현에서는 각 섹션의 내용이 일관성을 가지는지 확인
-        for section in sections:
-            self.assertIsInstance(section, str, f"섹션 '{section}'이 문자열이 아닙니다")
+        assert isinstance(section, str), f"섹션 '{section}'이 문자열이 아닙니다"
 
-    def test_evidence_attribution(self):
-        """근거 귀속 테스트"""
-        # 보고서의 각 주장이 적절한 근거를 가지는지 확인
-        test_claims = [
+    @pytest.mark.parametrize(
+        "claim",
+        [
             "강남구는 주요 상업지구입니다",
             "IT 업종이 발달했습니다",
             "정부 정책이 시행되고 있습니다",
-        ]
-
+        ],
+    )
+    def test_evidence_attribution(self, claim):
+        """근거 귀속 테스트"""
         # 실제 구현에서는 각 주장에 대한 근거를 확인
-        for claim in test_claims:
-            self.assertIsInstance(claim, str, "주장이 문자열이 아닙니다")
+        assert isinstance(claim, str), "주장이 문자열이 아닙니다"
 
     def test_language_quality(self):
         """언어 품질 테스트"""
@@ -404,13 +314,12 @@ class TestReportQuality(unittest.TestCase):
         test_text = "강남구는 서울시의 주요 상업지구로, 높은 부동산 가격과 활발한 상업 활동으로 유명합니다."
 
         # 기본적인 언어 품질 검사
-        self.assertGreater(len(test_text), 10, "텍스트가 너무 짧습니다")
-        self.assertIn("강남구", test_text, "텍스트에 핵심 키워드가 없습니다")
-        self.assertTrue(
-            test_text.endswith("습니다"), "텍스트가 적절히 끝나지 않았습니다"
-        )
+        assert len(test_text) > 10, "텍스트가 너무 짧습니다"
+        assert "강남구" in test_text, "텍스트에 핵심 키워드가 없습니다"
+        # 마침표를 제외하고 합쇼체 종결어미(-ㅂ니다/-습니다)로 끝나는지 확인
+        assert test_text.rstrip(".").endswith("니다"), "텍스트가 적절히 끝나지 않았습니다"
 
 
 if __name__ == "__main__":
     # 테스트 실행
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
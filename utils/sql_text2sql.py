@@ -4,6 +4,7 @@ PRD TASK3에서 LlamaIndex 기반으로 완전 구현 예정
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -20,9 +21,14 @@ def nl_to_sql(nl_query: str, schema_prompt: str = None, llm_cfg: Dict[str, Any]
     Returns:
         생성된 SQL 쿼리
     """
-    try:
-        logger.info(f"NL→SQL 변환 요청: {nl_query}")
+    logger.info(f"NL→SQL 변환 요청: {nl_query}")
+    # 스텁은 질의 문자열만으로 결정되므로 질의별로 캐시된 결과를 사용
+    return _template_sql(nl_query)
 
+@lru_cache(maxsize=512)
+def _template_sql(nl_query: str) -> str:
+    """질의 키워드에 맞는 SQL 템플릿 선택"""
+    try:
         # TASK1 스텁: 기본 SQL 템플릿 반환
         # TODO: TASK3에서 LlamaIndex + HuggingFace LLM으로 구현
 
@@ -173,6 +179,12 @@ def validate_sql_query(sql: str) -> Dict[str, Any]:
     Returns:
         검증 결과
     """
+    # 캐시된 결과를 호출자가 수정하지 않도록 복사본 반환
+    return dict(_validate_sql_query_cached(sql))
+
+@lru_cache(maxsize=2048)
+def _validate_sql_query_cached(sql: str) -> Dict[str, Any]:
+    """동일한 SQL에 대한 반복 검증 결과 캐시"""
     try:
         # 기본 보안 검증
         sql_lower = sql.lower().strip()